@@ -1,29 +1,623 @@
 import os
+import sys
 import json
-import feedparser
 import re
-from datetime import datetime
+import time
+import threading
+import hashlib
+import uuid
+import importlib.util
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
-import subprocess
 import shutil
 import platform
+import subprocess
 from pathlib import Path
 
+
+def _lazy_import(name):
+    """처음 속성에 접근할 때 실제로 로드되는 모듈 반환 (시작 시간 단축용)"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"모듈을 찾을 수 없습니다: {name}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# 무거운 모듈은 실제로 사용할 때 로드
+# (LazyLoader는 스레드에 안전하지 않으므로 스레드 풀을 쓰기 전에 _load_lazy_modules() 호출)
+feedparser = _lazy_import('feedparser')
+Image = _lazy_import('PIL.Image')
+ImageDraw = _lazy_import('PIL.ImageDraw')
+ImageFont = _lazy_import('PIL.ImageFont')
+ImageEnhance = _lazy_import('PIL.ImageEnhance')
+sqlite3 = _lazy_import('sqlite3')
+
+
+
+def _load_lazy_modules():
+    """지연 로드 모듈을 현재(메인) 스레드에서 끝까지 로드
+    (여러 스레드가 동시에 처음 접근하면 초기화 중인 모듈을 보고 AttributeError 발생)"""
+    # 속성에 한 번 접근하면 실제 로드가 실행됨
+    Image.open, ImageDraw.Draw, ImageFont.truetype, ImageEnhance.Brightness
+
+# 폰트/FFmpeg 탐색 결과 캐시 (경로별 mtime이 그대로일 때만 재사용)
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'daily_news_yh'
+)
+DISCOVERY_CACHE_PATH = os.path.join(CACHE_DIR, 'discovery.json')
+
+# 기사 이미지 캐시 (URL별 원본 파일 + ETag, 전체 크기 제한)
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, 'images')
+
+# 선호 순서대로 찾을 한글 폰트 패밀리 (fontconfig 이름)
+FONT_FAMILIES = ['NanumSquareRound', 'Noto Sans KR', 'Noto Sans CJK KR', 'NanumGothic',
+                 'Malgun Gothic', 'Apple SD Gothic Neo', 'AppleGothic']
+
+# 시작 시간 벤치마크 기준: import 직후 로드되면 안 되는 모듈과 허용 시간(ms)
+STARTUP_HEAVY_MODULES = ['PIL.Image', 'feedparser.api', 'requests', 'numpy']
+STARTUP_BUDGET_MS = 50
+
+# YouTube 메타데이터 한도 (초과하면 업로드가 400 오류로 거부됨)
+YOUTUBE_TITLE_MAX = 100
+YOUTUBE_DESCRIPTION_MAX_BYTES = 5000
+
+
+def benchmark_startup(repeats=5, budget_ms=STARTUP_BUDGET_MS):
+    """새 인터프리터에서 모듈 import 시간을 측정하고, 무거운 모듈이 미리 로드되지 않았는지 확인"""
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import step1_1_net_news as m\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "loaded = [n for n in m.STARTUP_HEAVY_MODULES if n in sys.modules\n"
+        "          and type(sys.modules[n]).__name__ != '_LazyModule']\n"
+        "print(elapsed)\n"
+        "print(','.join(loaded))\n"
+    )
+    timings = []
+    loaded = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, encoding='utf-8', errors='replace'
+        )
+        if result.returncode != 0:
+            print(f"[벤치마크] import 실패: {result.stderr}")
+            return False
+        lines = result.stdout.strip().splitlines()
+        timings.append(float(lines[0]))
+        loaded = [name for name in (lines[1].split(',') if len(lines) > 1 else []) if name]
+    
+    best = min(timings)
+    print(f"[벤치마크] import 시간: 최소 {best:.1f}ms / 최대 {max(timings):.1f}ms ({repeats}회, 기준 {budget_ms}ms)")
+    ok = True
+    if loaded:
+        print(f"[벤치마크] import 시점에 로드된 무거운 모듈: {', '.join(loaded)}")
+        ok = False
+    if best > budget_ms:
+        print(f"[벤치마크] import 시간이 기준을 초과했습니다.")
+        ok = False
+    return ok
+
+
+def normalize_build_time(value):
+    """예약 결합 시각을 HH:MM 형식으로 정규화 (예: '7:20' → '07:20', 잘못된 값이면 ValueError)"""
+    return datetime.strptime(value.strip(), '%H:%M').strftime('%H:%M')
+
+
+def find_latest_run(runs_dir=os.path.join("output", "runs"), fmt="shorts"):
+    """가장 최근에 완료된 실행 기록에서 fmt 포맷 출력 반환 (없으면 None)"""
+    latest = None
+    if not os.path.isdir(runs_dir):
+        return None
+    for name in os.listdir(runs_dir):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(runs_dir, name), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except Exception:
+            continue
+        for output in record.get("outputs", []):
+            if output.get("format") == fmt and os.path.exists(output.get("video", "")):
+                if latest is None or record["finished_at"] > latest[0]:
+                    latest = (record["finished_at"], output)
+    return latest[1] if latest else None
+
+
+class RunHistory:
+    """실행별 단계 시간, 카드 수, FFmpeg 속도, 출력 크기, 캐시 적중률을 저장하는 SQLite 이력"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            mode TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            success INTEGER NOT NULL,
+            total_seconds REAL NOT NULL,
+            card_count INTEGER NOT NULL,
+            output_bytes INTEGER NOT NULL,
+            encode_count INTEGER NOT NULL,
+            avg_speed REAL,
+            cache_hits INTEGER NOT NULL,
+            cache_misses INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS stages (
+            run_id TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            PRIMARY KEY (run_id, stage)
+        );
+        CREATE TABLE IF NOT EXISTS encodes (
+            run_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            media_seconds REAL,
+            wall_seconds REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS cache (
+            run_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            hits INTEGER NOT NULL,
+            misses INTEGER NOT NULL,
+            PRIMARY KEY (run_id, kind)
+        );
+        CREATE INDEX IF NOT EXISTS runs_mode_started ON runs (mode, started_at);
+    """
+    
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 여러 실행이 동시에 기록할 수 있으므로 잠금 대기 시간을 넉넉히
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(self.SCHEMA)
+        
+    def close(self):
+        self.conn.close()
+        
+    def record(self, run_id, mode, success, metrics, total_seconds):
+        """실행 1건의 측정값 저장 (FFmpeg 속도 = 결과 재생 시간 / 실제 걸린 시간)"""
+        encodes = metrics["encodes"]
+        speeds = [media / wall for _, media, wall in encodes if media and wall > 0]
+        hits = sum(counts[0] for counts in metrics["cache"].values())
+        misses = sum(counts[1] for counts in metrics["cache"].values())
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, mode, metrics["started_at"], int(bool(success)), total_seconds,
+                 metrics["cards"], metrics["output_bytes"], len(encodes),
+                 sum(speeds) / len(speeds) if speeds else None, hits, misses)
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO stages VALUES (?, ?, ?)",
+                [(run_id, stage, seconds) for stage, seconds in metrics["stages"].items()]
+            )
+            self.conn.executemany(
+                "INSERT INTO encodes VALUES (?, ?, ?, ?)",
+                [(run_id, kind, media, wall) for kind, media, wall in encodes]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                [(run_id, kind, counts[0], counts[1]) for kind, counts in metrics["cache"].items()]
+            )
+            
+    def _stages(self, run_id):
+        rows = self.conn.execute("SELECT stage, seconds FROM stages WHERE run_id = ?", (run_id,))
+        return dict(rows.fetchall())
+        
+    def report(self, window=10, tolerance=1.5, limit=20):
+        """최근 실행을 출력하고, 모드별 최신 실행 중 직전 window개 성공 실행의 중앙값보다
+        tolerance배 이상 느려진 항목 목록 반환 (실패한 최신 실행도 포함)"""
+        from statistics import median
+        
+        rows = self.conn.execute(
+            "SELECT run_id, mode, started_at, success, total_seconds, card_count, output_bytes, "
+            "encode_count, avg_speed, cache_hits, cache_misses FROM runs "
+            "ORDER BY started_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        if not rows:
+            print("[이력] 기록된 실행이 없습니다.")
+            return []
+        
+        print(f"{'run_id':<24} {'mode':<12} {'ok':<3} {'total(s)':>9} {'cards':>6} "
+              f"{'s/card':>7} {'speed':>7} {'MB':>7} {'cache':>6}")
+        for run_id, mode, _, success, total, cards, size, _, speed, hits, misses in rows:
+            per_card = f"{total / cards:.2f}" if cards else "-"
+            speed_text = f"{speed:.1f}x" if speed else "-"
+            cache_text = f"{hits / (hits + misses):.0%}" if hits + misses else "-"
+            print(f"{run_id:<24} {mode:<12} {'Y' if success else 'N':<3} {total:>9.1f} {cards:>6} "
+                  f"{per_card:>7} {speed_text:>7} {size / 1e6:>7.1f} {cache_text:>6}")
+        
+        regressions = []
+        latest_by_mode = {}
+        for row in rows:
+            latest_by_mode.setdefault(row[1], row)
+        for mode, (run_id, _, started_at, success, total, cards, _, _, speed, _, _) in latest_by_mode.items():
+            if not success:
+                regressions.append(f"{mode} {run_id}: 실행 실패")
+                continue
+            baseline = self.conn.execute(
+                "SELECT run_id, total_seconds, card_count, avg_speed FROM runs "
+                "WHERE mode = ? AND success = 1 AND started_at < ? "
+                "ORDER BY started_at DESC LIMIT ?", (mode, started_at, window)
+            ).fetchall()
+            if len(baseline) < 3:
+                # 기준선을 잡기에는 이력이 부족함
+                continue
+            
+            checks = [("전체 시간", total, median(row[1] for row in baseline))]
+            per_card = [row[1] / row[2] for row in baseline if row[2]]
+            if cards and per_card:
+                checks.append(("카드당 시간", total / cards, median(per_card)))
+            base_stages = defaultdict(list)
+            for row in baseline:
+                for stage, seconds in self._stages(row[0]).items():
+                    base_stages[stage].append(seconds)
+            for stage, seconds in self._stages(run_id).items():
+                if len(base_stages[stage]) >= 3:
+                    checks.append((f"{stage} 단계", seconds, median(base_stages[stage])))
+            for label, value, base in checks:
+                if base > 0 and value > base * tolerance:
+                    regressions.append(f"{mode} {run_id}: {label} {value:.1f}s (기준 {base:.1f}s)")
+            
+            # FFmpeg 속도는 낮아질수록 느려진 것
+            base_speeds = [row[3] for row in baseline if row[3]]
+            if speed and base_speeds and speed * tolerance < median(base_speeds):
+                regressions.append(f"{mode} {run_id}: FFmpeg 속도 {speed:.1f}x (기준 {median(base_speeds):.1f}x)")
+        
+        if regressions:
+            print("\n[이력] 기준선 대비 느려진 실행:")
+            for line in regressions:
+                print(f"- {line}")
+        else:
+            print("\n[이력] 기준선 대비 느려진 실행 없음")
+        return regressions
+
+
+class WorkQueue:
+    """공유 디렉토리 작업 큐 (pending → leased → done/failed)
+    작업은 파일 이름 변경으로 원자적으로 선점하고, 워커는 leased 파일의 mtime을 갱신해 임대를 유지함
+    (lease_timeout 동안 갱신이 없으면 워커가 죽은 것으로 보고 다시 pending으로 돌림)
+    임대 파일 이름에 선점한 워커의 토큰이 들어가므로, 임대를 잃은 워커는 결과를 기록하지 못함"""
+    
+    STATES = ('pending', 'leased', 'done', 'failed')
+    
+    def __init__(self, root, lease_timeout=300, max_attempts=3):
+        self.root = root
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.clips_dir = os.path.join(root, 'clips')
+        for state in self.STATES:
+            os.makedirs(os.path.join(root, state), exist_ok=True)
+        os.makedirs(self.clips_dir, exist_ok=True)
+        
+    def _path(self, state, job_id):
+        return os.path.join(self.root, state, f"{job_id}.json")
+        
+    def _write(self, state, job):
+        # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 숨김 파일에 쓴 뒤 이름 변경
+        partial_path = os.path.join(self.root, state, f".{job['job_id']}.{uuid.uuid4().hex[:6]}.partial")
+        with open(partial_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(partial_path, self._path(state, job['job_id']))
+        
+    def _read(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+            
+    def enqueue(self, job):
+        job.setdefault('attempts', 0)
+        self._write('pending', job)
+        
+    def claim(self):
+        """대기 작업 하나를 선점해 반환 (다른 워커가 먼저 가져가면 다음 작업, 없으면 None)"""
+        pending_dir = os.path.join(self.root, 'pending')
+        for name in sorted(os.listdir(pending_dir)):
+            if name.startswith('.') or not name.endswith('.json'):
+                continue
+            token = uuid.uuid4().hex[:8]
+            leased_path = os.path.join(self.root, 'leased', f"{name[:-5]}.{token}.json")
+            try:
+                os.rename(os.path.join(pending_dir, name), leased_path)
+            except OSError:
+                continue
+            # 이름 변경은 mtime을 유지하므로 임대 시작 시각으로 갱신
+            os.utime(leased_path)
+            job = self._read(leased_path)
+            if job is not None:
+                job['lease'] = token
+                return job
+        return None
+        
+    def _lease_path(self, job):
+        return os.path.join(self.root, 'leased', f"{job['job_id']}.{job['lease']}.json")
+        
+    def heartbeat(self, job):
+        """임대 갱신 (이미 만료되어 회수됐으면 False)"""
+        try:
+            os.utime(self._lease_path(job))
+            return True
+        except FileNotFoundError:
+            return False
+            
+    def _release(self, job, state):
+        """자기 임대가 남아 있을 때만 작업을 state로 옮김 (임대를 잃었으면 False)"""
+        # 먼저 임대 파일을 숨김 이름으로 바꿔 소유권을 확정 (만료 회수와 동시에 일어나도 한쪽만 성공)
+        releasing_path = os.path.join(self.root, 'leased', f".{job['job_id']}.{job['lease']}.json")
+        try:
+            os.rename(self._lease_path(job), releasing_path)
+        except OSError:
+            return False
+        os.utime(releasing_path)
+        job.pop('lease')
+        self._write(state, job)
+        self._remove(releasing_path)
+        return True
+        
+    def complete(self, job, result):
+        job['result'] = result
+        return self._release(job, 'done')
+        
+    def fail(self, job, error):
+        """실패 기록 후 max_attempts 전이면 다시 대기열로 (임대를 잃었으면 False)"""
+        return self._release(job, self._record_failure(job, error))
+        
+    def _record_failure(self, job, error):
+        job['attempts'] = job.get('attempts', 0) + 1
+        job['error'] = str(error)
+        return 'failed' if job['attempts'] >= self.max_attempts else 'pending'
+        
+    def requeue_expired(self):
+        """임대가 만료된 작업을 대기열로 되돌림 (여러 프로세스가 동시에 호출해도 한 번만 처리)"""
+        leased_dir = os.path.join(self.root, 'leased')
+        now = time.time()
+        for name in os.listdir(leased_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(leased_dir, name)
+            try:
+                if now - os.path.getmtime(path) < self.lease_timeout:
+                    continue
+                expired_path = os.path.join(self.root, 'pending', f".{name}.expired")
+                os.rename(path, expired_path)
+            except OSError:
+                continue
+            job = self._read(expired_path)
+            if job is not None:
+                print(f"[큐] 임대 만료, 작업 재등록: {job['job_id']}")
+                self._write(self._record_failure(job, "임대 만료"), job)
+            self._remove(expired_path)
+            
+    def results(self, job_ids):
+        """완료/최종 실패한 작업 {job_id: (상태, 작업)}"""
+        results = {}
+        for job_id in job_ids:
+            for state in ('done', 'failed'):
+                job = self._read(self._path(state, job_id))
+                if job is not None:
+                    results[job_id] = (state, job)
+                    break
+        return results
+        
+    def discard(self, job_ids, batch):
+        """배치의 남은 작업 파일과 클립 삭제"""
+        for job_id in job_ids:
+            for state in ('pending', 'done', 'failed'):
+                self._remove(self._path(state, job_id))
+        shutil.rmtree(os.path.join(self.clips_dir, batch), ignore_errors=True)
+        
+    def purge_stale(self, max_age=86400):
+        """중단된 배치가 남긴 오래된 결과/클립 정리"""
+        cutoff = time.time() - max_age
+        for state in ('done', 'failed'):
+            state_dir = os.path.join(self.root, state)
+            for name in os.listdir(state_dir):
+                path = os.path.join(state_dir, name)
+                if os.path.getmtime(path) < cutoff:
+                    self._remove(path)
+        for name in os.listdir(self.clips_dir):
+            path = os.path.join(self.clips_dir, name)
+            if os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+class ConcatTree:
+    """클립을 group_size개씩 묶어 트리 형태로 바로바로 결합
+    (결합된 입력 파일은 즉시 삭제하므로 임시 디스크 사용량이 카드 수와 무관하게 제한됨)"""
+    
+    def __init__(self, processor, work_dir, group_size=32):
+        self.processor = processor
+        self.work_dir = work_dir
+        self.group_size = max(2, group_size)
+        self.levels = []  # levels[k]: k단계 결합 결과 (앞쪽 클립일수록 높은 단계)
+        self.clip_count = 0
+        self._merge_count = 0
+        os.makedirs(work_dir, exist_ok=True)
+        
+    def add(self, clip_path):
+        """클립 추가 (group_size개가 모이면 상위 단계로 결합)"""
+        self.clip_count += 1
+        self._push(0, clip_path)
+        
+    def _push(self, level, path):
+        while len(self.levels) <= level:
+            self.levels.append([])
+        self.levels[level].append(path)
+        if len(self.levels[level]) >= self.group_size:
+            merged = self._merge(self.levels[level])
+            self.levels[level] = []
+            self._push(level + 1, merged)
+            
+    def _merge(self, paths):
+        """클립 결합 후 입력 파일 삭제"""
+        self._merge_count += 1
+        output_path = os.path.join(self.work_dir, f"merge_{self._merge_count:05d}.mp4")
+        list_file = os.path.join(self.work_dir, f"merge_{self._merge_count:05d}.txt")
+        try:
+            success, stderr = self.processor._concat_clips(paths, output_path, list_file)
+        finally:
+            if os.path.exists(list_file):
+                os.remove(list_file)
+        if not success or not os.path.exists(output_path):
+            raise Exception(f"클립 결합 실패: {stderr}")
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+        return output_path
+        
+    def finish(self):
+        """남은 클립을 순서대로 결합해 최종 파일 경로 반환"""
+        remaining = [path for level in reversed(self.levels) for path in level]
+        self.levels = []
+        if not remaining:
+            return None
+        while len(remaining) > 1:
+            groups = [remaining[i:i + self.group_size] for i in range(0, len(remaining), self.group_size)]
+            remaining = [self._merge(group) if len(group) > 1 else group[0] for group in groups]
+        return remaining[0]
+
+
+class NearDuplicateIndex:
+    """문자 shingle + MinHash/LSH 기반 유사 기사 탐지
+    (대표 기사만 색인에 남기므로 같은 기사의 변형은 처음 들어온 것 하나만 통과)"""
+    
+    def __init__(self, num_perm=128, bands=32, threshold=0.5, shingle_size=3, seed=1):
+        import numpy as np
+        
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        # multiply-shift 해시 (a*x + b) >> 32 로 순열 근사 (a는 홀수, uint64 자리 넘침은 의도된 것)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._b = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True)
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+        self._signatures = []
+        
+    def _shingle_hashes(self, text):
+        """공백/기호를 제거한 문자 n-gram을 코드포인트 21비트씩 이어붙인 정수로 (중복 제거)"""
+        import numpy as np
+        
+        text = re.sub(r'[\W_]+', '', text.lower()) or ' '
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        k = min(self.shingle_size, len(codes))
+        shingles = np.zeros(len(codes) - k + 1, dtype=np.uint64)
+        for offset in range(k):
+            shingles = (shingles << np.uint64(21)) | codes[offset:len(codes) - k + 1 + offset]
+        return np.unique(shingles)
+        
+    def signatures(self, texts, chunk_shingles=20000):
+        """MinHash 서명 행렬 (len(texts) x num_perm), 여러 문서를 한 번에 NumPy로 계산"""
+        import numpy as np
+        
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint64)
+        hashes = [self._shingle_hashes(text) for text in texts]
+        start = 0
+        while start < len(texts):
+            # 중간 행렬 크기를 제한하기 위해 shingle 수 기준으로 문서를 묶어서 처리
+            end, total = start, 0
+            while end < len(texts) and (end == start or total + len(hashes[end]) <= chunk_shingles):
+                total += len(hashes[end])
+                end += 1
+            flat = np.concatenate(hashes[start:end])
+            offsets = np.cumsum([0] + [len(doc) for doc in hashes[start:end - 1]])
+            permuted = flat[:, None] * self._a[None, :]
+            permuted += self._b
+            permuted >>= np.uint64(32)
+            result[start:end] = np.minimum.reduceat(permuted, offsets, axis=0)
+            start = end
+        return result
+        
+    def add(self, texts):
+        """문서들을 순서대로 색인 (반환: 문서별 대표 여부, False면 앞선 문서의 유사 기사)"""
+        import numpy as np
+        
+        keep = []
+        for signature in self.signatures(texts):
+            keys = [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+            candidates = {idx for band, key in enumerate(keys) for idx in self._buckets[band].get(key, ())}
+            duplicate = any(
+                np.count_nonzero(self._signatures[idx] == signature) / self.num_perm >= self.threshold
+                for idx in candidates
+            )
+            keep.append(not duplicate)
+            if not duplicate:
+                idx = len(self._signatures)
+                self._signatures.append(signature)
+                for band, key in enumerate(keys):
+                    self._buckets[band][key].append(idx)
+        return keep
+
+
+class NewsItem:
+    """뉴스 1건 (원본 값만 보관하고 카드/메타데이터용 문구는 출력 시점에 만듦)"""
+    __slots__ = ('id', 'title', 'summary', 'url', 'category', 'published', 'author', 'image_url', 'image_path')
+    
+    def __init__(self, title, summary, url, category, published=None, author='연합뉴스',
+                 image_url=None, image_path=None, id=None):
+        self.id = id
+        self.title = title
+        self.summary = summary
+        self.url = url
+        self.category = category
+        self.published = published  # datetime (UTC) 또는 None
+        self.author = author
+        self.image_url = image_url
+        self.image_path = image_path
+        
+    def __repr__(self):
+        return f"NewsItem(id={self.id!r}, category={self.category!r}, title={self.title!r})"
+        
+    def to_dict(self):
+        """JSON 저장용 dict (published는 ISO 문자열)"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if self.published:
+            data['published'] = self.published.isoformat()
+        return data
+        
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        if data.get('published'):
+            data['published'] = datetime.fromisoformat(data['published'])
+        return cls(**data)
+
+
 class NewsProcessor:
     def __init__(self):
         # 기본 설정
         self.base_dir = "output"
         self.images_dir = os.path.join(self.base_dir, "images")
         self.videos_dir = os.path.join(self.base_dir, "videos")
-        self.temp_dir = "temp"
+        self.runs_dir = os.path.join(self.base_dir, "runs")
+        self.history_path = os.path.join(self.base_dir, "run_history.sqlite")
+        # 롱폼(주간 모음)용으로 실행마다 수집한 뉴스를 날짜별 파일(YYYYMMDD.jsonl)에 누적 보관
+        # 추가만 하고 다시 쓰지 않으며, 보관 기간(일)이 지난 날짜 파일은 통째로 삭제
+        self.news_archive_dir = os.path.join(self.base_dir, "news_archive")
+        self.news_archive_days = 31
+        self.temp_root = "temp"
         self.assets_dir = "assets"
         self.max_dirs = 2
-        
-        # 타임스탬프 설정
-        self.timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-        self.image_output_dir = os.path.join(self.images_dir, self.timestamp)
-        self.video_output_dir = os.path.join(self.videos_dir, self.timestamp)
+        # 이 시간(초) 동안 owner.json이 갱신되지 않은 실행은 중단된 것으로 봄 (다른 호스트, PID 재사용 대비)
+        self.stale_run_age = 24 * 3600
         
         # 카드 비율 9:13 (예: 1080x1560)
         self.WIDTH = 1080
@@ -37,29 +631,292 @@ class NewsProcessor:
         self.fade_duration = 0.5
         self.zoom_scale = 1.1
         
+        # 카드 렌더러: "pillow" (카드 PNG 생성 후 인코딩) 또는 "drawtext" (FFmpeg 안에서 템플릿 위에 텍스트 합성)
+        self.renderer = "pillow"
+        
+        # 기사 이미지 슬롯 (기본 사용 안 함): 동시 다운로드 수, 캐시 최대 크기, 다운로드 최대 크기
+        self.card_images = False
+        self.image_fetch_workers = 4
+        self.image_cache_max_bytes = 200 * 1024 * 1024
+        self.image_max_download_bytes = 10 * 1024 * 1024
+        self.IMAGE_SLOT_MAX_HEIGHT = 480
+        self.IMAGE_SLOT_MIN_HEIGHT = 200
+        
+        # 유사 기사 제거 (제목+요약 MinHash 유사도 기준)
+        self.dedupe_news = True
+        self.dedupe_threshold = 0.5
+        self._dedupe_index = None
+        
+        # FFmpeg 감시: 시간 예산 = 기본 + 영상 길이(초) x 배수, 진행 없음 허용 시간, 재시도 횟수
+        self.ffmpeg_base_timeout = 60
+        self.ffmpeg_timeout_factor = 20
+        self.ffmpeg_stall_timeout = 30
+        self.ffmpeg_retries = 2
+        
+        # 멀티 포맷 출력 (포맷명: (가로, 세로)), shorts는 기존 단일 출력과 동일
+        self.OUTPUT_FORMATS = {
+            "shorts": (1080, 1920),
+            "square": (1080, 1080),
+            "landscape": (1920, 1080)
+        }
+        
         # 카테고리별 색상
         self.CATEGORY_COLORS = {
             "[스포츠]": (60, 179, 113),
             "[연예]": (186, 104, 200)
         }
         
+        # 상주(watch) 모드에서 재사용하는 리소스
+        self.watch_workers = max(1, (os.cpu_count() or 2) // 2)
+        # 피드에서 이 시간(초) 동안 보이지 않은 링크는 확인 목록에서 삭제 (메모리 제한)
+        self.watch_link_ttl = 2 * 86400
+        # 작업 큐 모드 (워커가 이 시간 동안 임대를 갱신하지 않으면 작업 회수)
+        self.queue_lease_timeout = 300
+        self.queue_poll_interval = 5
+        self._http_session = None
+        self._feed_cache = {}
+        self._card_template = None
+        self._card_fonts = None
+        self._render_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        
+        # 폰트/FFmpeg는 처음 사용할 때 탐색 (fonts, ffmpeg_path 속성)
+        self._fonts = None
+        self._ffmpeg_path = None
+        
         # 초기화
         self._initialize_system()
         
     def _initialize_system(self):
-        """시스템 초기화"""
-        # 디렉토리 생성
+        """시스템 초기화 (폰트와 FFmpeg는 처음 사용할 때 탐색)"""
+        # 실행별 작업 공간 생성
+        os.makedirs(self.runs_dir, exist_ok=True)
+        self._reap_stale_runs()
+        self._start_run()
+        
+    def _start_run(self):
+        """새 실행 ID로 작업 공간 준비 (동시에 여러 실행이 돌아도 임시/출력 파일이 겹치지 않음)"""
+        now = datetime.now()
+        self.timestamp = now.strftime('%Y%m%d_%H%M')
+        self.run_id = f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.image_output_dir = os.path.join(self.images_dir, self.run_id)
+        self.video_output_dir = os.path.join(self.videos_dir, self.run_id)
+        # 임시 디렉토리는 실행 중 표시도 겸함 (정리 대상에서 제외)
+        self.temp_dir = os.path.join(self.temp_root, self.run_id)
         os.makedirs(self.image_output_dir, exist_ok=True)
         os.makedirs(self.video_output_dir, exist_ok=True)
         os.makedirs(self.temp_dir, exist_ok=True)
+        with open(os.path.join(self.temp_dir, "owner.json"), "w", encoding="utf-8") as f:
+            json.dump({"host": platform.node(), "pid": os.getpid()}, f)
+        
+        # 실행 이력용 측정값 (단계별 시간, FFmpeg 작업, 캐시 적중, 카드 수, 출력 크기)
+        self.metrics = {
+            "started_at": now.isoformat(timespec='seconds'),
+            "started": time.perf_counter(),
+            "clock": time.perf_counter(),
+            "stages": {},
+            "encodes": [],
+            "cache": defaultdict(lambda: [0, 0]),
+            "cards": 0,
+            "output_bytes": 0
+        }
+        
+    def _mark_stage(self, stage):
+        """직전 표시 이후 걸린 시간을 stage 단계 시간으로 기록"""
+        now = time.perf_counter()
+        stages = self.metrics["stages"]
+        stages[stage] = stages.get(stage, 0) + now - self.metrics["clock"]
+        self.metrics["clock"] = now
+        self._touch_run()
+        
+    def _touch_run(self):
+        """실행 중 표시 갱신 (다른 호스트에서 중단된 실행으로 오인하지 않게)"""
+        try:
+            os.utime(os.path.join(self.temp_dir, "owner.json"))
+        except OSError:
+            pass
+        
+    def _count_cache(self, kind, hit):
+        """캐시 적중/실패 횟수 기록"""
+        with self._metrics_lock:
+            self.metrics["cache"][kind][0 if hit else 1] += 1
+            
+    def _record_run(self, mode, success):
+        """이번 실행의 측정값을 실행 이력 DB에 저장"""
+        try:
+            history = RunHistory(self.history_path)
+            history.record(self.run_id, mode, success, self.metrics,
+                           time.perf_counter() - self.metrics["started"])
+            history.close()
+        except Exception as e:
+            print(f"[이력] 실행 이력 저장 실패: {e}")
+            
+    def _run_recorded(self, mode, func, *args):
+        """func 실행 결과와 측정값을 실행 이력에 기록"""
+        success = False
+        try:
+            success = func(*args)
+            return success
+        finally:
+            self._record_run(mode, success)
+        
+    def _run_is_active(self, run_id):
+        """run_id 실행이 아직 진행 중인지 확인
+        (진행 중인 실행은 _touch_run으로 owner.json을 갱신하므로 stale_run_age 기준,
+        같은 호스트에서 프로세스가 없으면 바로 중단된 것으로 봄)"""
+        temp_dir = os.path.join(self.temp_root, run_id)
+        if not os.path.isdir(temp_dir):
+            return False
+        owner_path = os.path.join(temp_dir, "owner.json")
+        try:
+            with open(owner_path, "r", encoding="utf-8") as f:
+                owner = json.load(f)
+            age = time.time() - os.path.getmtime(owner_path)
+        except (OSError, ValueError):
+            owner = {}
+            age = time.time() - os.path.getmtime(temp_dir)
+        # Windows의 os.kill은 신호 0도 프로세스를 종료시키므로 나이로만 판단
+        if owner.get("host") == platform.node() and os.name != 'nt':
+            try:
+                os.kill(owner["pid"], 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                pass
+        # 프로세스가 있어도 PID가 재사용됐을 수 있으므로 갱신이 끊긴 실행은 중단된 것으로 봄
+        return age < self.stale_run_age
         
-        # 폰트 초기화
-        self.fonts = self._initialize_fonts()
-        if not self.fonts:
-            raise Exception("필요한 폰트를 찾을 수 없습니다.")
+    def _reap_stale_runs(self):
+        """강제 종료(SIGKILL, OOM, CI 시간 초과)로 남은 임시 디렉토리 삭제
+        (남아 있으면 해당 실행의 출력 디렉토리가 정리 대상에서 계속 제외됨)"""
+        if not os.path.isdir(self.temp_root):
+            return
+        for run_id in os.listdir(self.temp_root):
+            if run_id != getattr(self, 'run_id', None) and not self._run_is_active(run_id):
+                shutil.rmtree(os.path.join(self.temp_root, run_id), ignore_errors=True)
+                print(f"[정리] 중단된 실행의 임시 디렉토리 삭제: {run_id}")
+        
+    def _finish_run(self):
+        """실행 임시 디렉토리 삭제"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def _publish(self, staged_path, final_path):
+        """임시 디렉토리에서 완성된 파일을 최종 위치로 원자적으로 이동"""
+        try:
+            os.replace(staged_path, final_path)
+        except OSError:
+            # 다른 파일시스템이면 같은 디렉토리에 복사한 뒤 이름 변경
+            partial_path = f"{final_path}.partial"
+            shutil.copyfile(staged_path, partial_path)
+            os.replace(partial_path, final_path)
+            os.remove(staged_path)
+        return final_path
+        
+    def _register_run(self, outputs):
+        """완료된 실행을 runs 디렉토리에 기록 (실행마다 자기 파일만 쓰므로 잠금 불필요)"""
+        record = {
+            "run_id": self.run_id,
+            "timestamp": self.timestamp,
+            "finished_at": datetime.now().isoformat(timespec='seconds'),
+            "outputs": [
+                {key: value.replace("\\", "/") if isinstance(value, str) else value
+                 for key, value in output.items()}
+                for output in outputs
+            ]
+        }
+        self.metrics["output_bytes"] = sum(
+            os.path.getsize(output["video"]) for output in outputs if os.path.exists(output.get("video", ""))
+        )
+        staged_path = os.path.join(self.temp_dir, f"{self.run_id}.json")
+        with open(staged_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        return self._publish(staged_path, os.path.join(self.runs_dir, f"{self.run_id}.json"))
+        
+    @property
+    def fonts(self):
+        """제목/본문 폰트 (처음 사용할 때 탐색 후 로드)"""
+        if self._fonts is None:
+            self._fonts = self._initialize_fonts()
+            if not self._fonts:
+                raise Exception("필요한 폰트를 찾을 수 없습니다.")
+        return self._fonts
+        
+    @property
+    def ffmpeg_path(self):
+        """FFmpeg 실행 파일 경로 (처음 사용할 때 탐색)"""
+        if self._ffmpeg_path is None:
+            self._ffmpeg_path = self._get_ffmpeg_path()
+        return self._ffmpeg_path
+        
+    def _load_discovery_cache(self):
+        """탐색 캐시 읽기"""
+        try:
+            with open(DISCOVERY_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+            
+    def _cached_discovery(self, key):
+        """캐시된 경로 목록 반환 (파일이 없거나 mtime이 바뀌었으면 None)"""
+        entry = self._load_discovery_cache().get(key)
+        if not entry:
+            return None
+        try:
+            for path, mtime in zip(entry['paths'], entry['mtimes']):
+                if os.path.getmtime(path) != mtime:
+                    return None
+        except OSError:
+            return None
+        return entry['paths']
+        
+    def _store_discovery(self, key, paths):
+        """탐색 결과를 mtime과 함께 캐시에 저장"""
+        try:
+            cache = self._load_discovery_cache()
+            cache[key] = {'paths': list(paths), 'mtimes': [os.path.getmtime(p) for p in paths]}
+            os.makedirs(os.path.dirname(DISCOVERY_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{DISCOVERY_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, DISCOVERY_CACHE_PATH)
+        except Exception as e:
+            print(f"[초기화] 탐색 캐시 저장 실패: {e}")
             
-        # FFmpeg 경로 설정
-        self.ffmpeg_path = self._get_ffmpeg_path()
+    def _fontconfig_font_pairs(self):
+        """fontconfig(fc-list)로 설치된 한글 폰트의 (볼드, 레귤러) 경로 후보 반환"""
+        fc_list = shutil.which('fc-list')
+        if not fc_list:
+            return []
+        try:
+            output = subprocess.run(
+                [fc_list, ':lang=ko', 'file', 'family', 'style'],
+                capture_output=True, encoding='utf-8', errors='replace', timeout=10
+            ).stdout
+        except Exception as e:
+            print(f"[초기화] fontconfig 조회 실패: {e}")
+            return []
+        
+        # "경로: 패밀리1,패밀리2:style=Bold,..." 형식
+        fonts = defaultdict(dict)
+        for line in output.splitlines():
+            parts = line.split(':')
+            if len(parts) < 3:
+                continue
+            path = parts[0].strip()
+            families = [f.strip() for f in parts[1].split(',')]
+            styles = parts[2].replace('style=', '').lower()
+            weight = 'bold' if 'bold' in styles else 'regular' if 'regular' in styles or 'normal' in styles else None
+            if not weight:
+                continue
+            for family in families:
+                fonts[family].setdefault(weight, path)
+        
+        pairs = []
+        for family in FONT_FAMILIES:
+            found = fonts.get(family, {})
+            if 'regular' in found:
+                pairs.append((found.get('bold', found['regular']), found['regular']))
+        return pairs
         
     def _initialize_fonts(self):
         """시스템별 모던/심플 폰트 초기화 (볼드/레귤러)"""
@@ -80,21 +937,42 @@ class NewsProcessor:
             ]
         }
         system = platform.system()
-        for bold_path, regular_path in font_paths.get(system, []):
-            if os.path.exists(bold_path) and os.path.exists(regular_path):
-                try:
-                    return {
-                        'title': ImageFont.truetype(bold_path, 54),
-                        'body': ImageFont.truetype(regular_path, 36),
-                        'category': ImageFont.truetype(regular_path, 30),
-                        'source': ImageFont.truetype(regular_path, 28)
-                    }
-                except Exception as e:
-                    print(f"폰트 로드 실패 ({bold_path}, {regular_path}): {e}")
+        cached = self._cached_discovery('fonts')
+        self._count_cache('discovery', bool(cached))
+        
+        def candidates():
+            # 1. 캐시된 탐색 결과 (파일 mtime이 그대로일 때만)
+            if cached:
+                yield tuple(cached)
+            # 2. 알려진 설치 경로, 없으면 3. fontconfig 조회
+            known = [pair for pair in font_paths.get(system, [])
+                     if os.path.exists(pair[0]) and os.path.exists(pair[1])]
+            yield from known
+            if not known:
+                yield from self._fontconfig_font_pairs()
+        
+        for bold_path, regular_path in candidates():
+            try:
+                fonts = {
+                    'title': ImageFont.truetype(bold_path, 54),
+                    'body': ImageFont.truetype(regular_path, 36),
+                    'category': ImageFont.truetype(regular_path, 30),
+                    'source': ImageFont.truetype(regular_path, 28)
+                }
+                if [bold_path, regular_path] != cached:
+                    self._store_discovery('fonts', [bold_path, regular_path])
+                return fonts
+            except Exception as e:
+                print(f"폰트 로드 실패 ({bold_path}, {regular_path}): {e}")
         return None
         
     def _get_ffmpeg_path(self):
-        """FFmpeg 경로 확인"""
+        """FFmpeg 경로 확인 (캐시 → PATH → 알려진 설치 경로)"""
+        cached = self._cached_discovery('ffmpeg')
+        self._count_cache('discovery', bool(cached))
+        if cached:
+            return cached[0]
+        
         if platform.system() == "Windows":
             paths = [
                 "D:\\ffmpeg\\bin\\ffmpeg.exe",
@@ -108,8 +986,9 @@ class NewsProcessor:
                 "/opt/homebrew/bin/ffmpeg"
             ]
         
-        for path in paths:
-            if os.path.exists(path):
+        for path in [shutil.which("ffmpeg")] + paths:
+            if path and os.path.exists(path):
+                self._store_discovery('ffmpeg', [path])
                 return path
         raise Exception("FFmpeg를 찾을 수 없습니다.")
         
@@ -122,6 +1001,9 @@ class NewsProcessor:
             dirs = []
             for d in os.listdir(target_dir):
                 full_path = os.path.join(target_dir, d)
+                # 다른 실행이 아직 사용 중인 디렉토리는 건드리지 않음
+                if d != self.run_id and self._run_is_active(d):
+                    continue
                 if os.path.isdir(full_path):
                     try:
                         created_time = os.path.getctime(full_path)
@@ -177,142 +1059,325 @@ class NewsProcessor:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
         
-    def collect_news(self):
-        """뉴스 수집: RSS.txt 파일에서 RSS URL 읽기"""
+    def _load_rss_settings(self):
+        """RSS.txt 설정 읽기: (RSS URL 목록, 카테고리별 최대 개수, 전체 최대 개수)"""
+        rss_urls = {}
+        max_per_category = 10  # 기본값
+        total_max = 20  # 기본값
         try:
-            print("\n=== 1단계: 뉴스 수집 시작 ===")
-            
-            # assets/RSS.txt 파일에서 RSS URL 불러오기
-            rss_urls = {}
-            max_per_category = 10  # 기본값
-            total_max = 20  # 기본값
-            try:
-                with open(os.path.join(self.assets_dir, 'RSS.txt'), 'r', encoding='utf-8') as f:
-                    read_urls = False
-                    read_card_count = False
-                    read_video_length = False
+            with open(os.path.join(self.assets_dir, 'RSS.txt'), 'r', encoding='utf-8') as f:
+                read_urls = False
+                read_card_count = False
+                read_video_length = False
+                
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
                     
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
+                    # RSS URL 읽기
+                    if '[RSS_URL 지정]' in line:
+                        read_urls = True
+                        read_card_count = False
+                        read_video_length = False
+                        continue
+                    # 카드뉴스 개수 설정 읽기
+                    elif '[카드뉴스개수]' in line:
+                        read_urls = False
+                        read_card_count = True
+                        read_video_length = False
+                        continue
+                    # 동영상 길이 설정 읽기
+                    elif '[동영상길이]' in line:
+                        read_urls = False
+                        read_card_count = False
+                        read_video_length = True
+                        continue
+                    elif line.startswith('['):
+                        read_urls = False
+                        read_card_count = False
+                        read_video_length = False
+                        continue
                         
-                        # RSS URL 읽기
-                        if '[RSS_URL 지정]' in line:
-                            read_urls = True
-                            read_card_count = False
-                            read_video_length = False
-                            continue
-                        # 카드뉴스 개수 설정 읽기
-                        elif '[카드뉴스개수]' in line:
-                            read_urls = False
-                            read_card_count = True
-                            read_video_length = False
-                            continue
-                        # 동영상 길이 설정 읽기
-                        elif '[동영상길이]' in line:
-                            read_urls = False
-                            read_card_count = False
-                            read_video_length = True
-                            continue
-                        elif line.startswith('['):
-                            read_urls = False
-                            read_card_count = False
-                            read_video_length = False
-                            continue
+                    # 각 설정 값 파싱
+                    if read_urls and line.startswith('http'):
+                        # URL에서 카테고리 추출 (예: sports, entertainment)
+                        if 'rss/' in line and '.xml' in line:
+                            category = line.split('rss/')[1].split('.xml')[0]
+                            category = category.capitalize()  # 첫 글자 대문자로
+                            rss_urls[category] = line
+                    
+                    # 카드뉴스 개수 설정 파싱
+                    elif read_card_count and ':' in line:
+                        parts = line.split(':')
+                        if len(parts) > 1:
+                            value_part = parts[1].strip()
                             
-                        # 각 설정 값 파싱
-                        if read_urls and line.startswith('http'):
-                            # URL에서 카테고리 추출 (예: sports, entertainment)
-                            if 'rss/' in line and '.xml' in line:
-                                category = line.split('rss/')[1].split('.xml')[0]
-                                category = category.capitalize()  # 첫 글자 대문자로
-                                rss_urls[category] = line
-                        
-                        # 카드뉴스 개수 설정 파싱
-                        elif read_card_count and ':' in line:
-                            parts = line.split(':')
-                            if len(parts) > 1:
-                                value_part = parts[1].strip()
+                            # 카테고리별 개수 추출
+                            if ',' in value_part and '개' in value_part:
+                                cat_part = value_part.split(',')[0].strip()
+                                total_part = value_part.split(',')[1].strip()
                                 
-                                # 카테고리별 개수 추출
-                                if ',' in value_part and '개' in value_part:
-                                    cat_part = value_part.split(',')[0].strip()
-                                    total_part = value_part.split(',')[1].strip()
-                                    
-                                    # 카테고리별 최대 개수
-                                    if '개' in cat_part:
-                                        try:
-                                            extracted_num = cat_part.split('개')[0].strip()
-                                            max_per_category = int(extracted_num)
-                                            print(f"[설정] 카테고리별 카드뉴스 개수: {max_per_category}개")
-                                        except:
-                                            print(f"[설정] 카테고리별 카드뉴스 개수 파싱 실패, 기본값 {max_per_category}개 사용")
-                                    
-                                    # 전체 최대 개수
-                                    if '최대' in total_part and '개' in total_part:
-                                        try:
-                                            extracted_num = total_part.split('최대')[1].split('개')[0].strip()
-                                            total_max = int(extracted_num)
-                                            print(f"[설정] 전체 최대 카드뉴스 개수: {total_max}개")
-                                        except:
-                                            print(f"[설정] 전체 최대 카드뉴스 개수 파싱 실패, 기본값 {total_max}개 사용")
-                        
-                        # 동영상 길이 설정 파싱
-                        elif read_video_length and ':' in line:
-                            parts = line.split(':')
-                            if len(parts) > 1 and '초' in parts[1]:
-                                try:
-                                    seconds_str = parts[1].strip().split('초')[0].strip()
-                                    seconds = int(seconds_str)
-                                    self.duration = seconds
-                                    print(f"[설정] 카드뉴스별 동영상 길이: {self.duration}초")
-                                except:
-                                    print(f"[설정] 동영상 길이 파싱 실패, 기본값 {self.duration}초 사용")
-                
-                if not rss_urls:
-                    print("[수집] RSS.txt 파일에서 RSS URL을 찾을 수 없습니다. 기본 RSS URL을 사용합니다.")
-                    # 기본 RSS URL 설정
-                    rss_urls = {
-                        "스포츠": "https://www.yna.co.kr/rss/sports.xml",
-                        "연예": "https://www.yna.co.kr/rss/entertainment.xml"
-                    }
-                else:
-                    print(f"[수집] RSS.txt 파일에서 {len(rss_urls)}개 RSS URL을 불러왔습니다.")
-                    for cat, url in rss_urls.items():
-                        print(f"- {cat}: {url}")
-            except Exception as e:
-                print(f"[수집] RSS.txt 파일 읽기 실패: {e}")
+                                # 카테고리별 최대 개수
+                                if '개' in cat_part:
+                                    try:
+                                        extracted_num = cat_part.split('개')[0].strip()
+                                        max_per_category = int(extracted_num)
+                                        print(f"[설정] 카테고리별 카드뉴스 개수: {max_per_category}개")
+                                    except:
+                                        print(f"[설정] 카테고리별 카드뉴스 개수 파싱 실패, 기본값 {max_per_category}개 사용")
+                                
+                                # 전체 최대 개수
+                                if '최대' in total_part and '개' in total_part:
+                                    try:
+                                        extracted_num = total_part.split('최대')[1].split('개')[0].strip()
+                                        total_max = int(extracted_num)
+                                        print(f"[설정] 전체 최대 카드뉴스 개수: {total_max}개")
+                                    except:
+                                        print(f"[설정] 전체 최대 카드뉴스 개수 파싱 실패, 기본값 {total_max}개 사용")
+                    
+                    # 동영상 길이 설정 파싱
+                    elif read_video_length and ':' in line:
+                        parts = line.split(':')
+                        if len(parts) > 1 and '초' in parts[1]:
+                            try:
+                                seconds_str = parts[1].strip().split('초')[0].strip()
+                                seconds = int(seconds_str)
+                                self.duration = seconds
+                                print(f"[설정] 카드뉴스별 동영상 길이: {self.duration}초")
+                            except:
+                                print(f"[설정] 동영상 길이 파싱 실패, 기본값 {self.duration}초 사용")
+            
+            if not rss_urls:
+                print("[수집] RSS.txt 파일에서 RSS URL을 찾을 수 없습니다. 기본 RSS URL을 사용합니다.")
                 # 기본 RSS URL 설정
                 rss_urls = {
                     "스포츠": "https://www.yna.co.kr/rss/sports.xml",
                     "연예": "https://www.yna.co.kr/rss/entertainment.xml"
                 }
+            else:
+                print(f"[수집] RSS.txt 파일에서 {len(rss_urls)}개 RSS URL을 불러왔습니다.")
+                for cat, url in rss_urls.items():
+                    print(f"- {cat}: {url}")
+        except Exception as e:
+            print(f"[수집] RSS.txt 파일 읽기 실패: {e}")
+            # 기본 RSS URL 설정
+            rss_urls = {
+                "스포츠": "https://www.yna.co.kr/rss/sports.xml",
+                "연예": "https://www.yna.co.kr/rss/entertainment.xml"
+            }
+        
+        return rss_urls, max_per_category, total_max
+    
+    def _get_http_session(self):
+        """피드 요청용 HTTP 세션 (연결 재사용)"""
+        if self._http_session is None:
+            import requests
+            self._http_session = requests.Session()
+            self._http_session.headers['User-Agent'] = 'daily-news-yh/1.0'
+        return self._http_session
+    
+    def _fetch_feed_entries(self, rss_url):
+        """RSS 피드 항목 가져오기 (ETag/Last-Modified 조건부 요청, 변경 없으면 빈 목록)"""
+        try:
+            session = self._get_http_session()
+            headers = {}
+            cached = self._feed_cache.get(rss_url, {})
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                headers['If-Modified-Since'] = cached['modified']
+            
+            response = session.get(rss_url, headers=headers, timeout=15)
+            if response.status_code == 304:
+                return []
+            response.raise_for_status()
+            
+            self._feed_cache[rss_url] = {
+                'etag': response.headers.get('ETag'),
+                'modified': response.headers.get('Last-Modified')
+            }
+            return feedparser.parse(response.content).entries
+        except Exception as e:
+            print(f"[수집] HTTP 요청 실패, feedparser로 재시도 ({rss_url}): {e}")
+            return feedparser.parse(rss_url).entries
+    
+    def _entry_to_news(self, entry, category):
+        """RSS 항목을 뉴스 데이터로 변환"""
+        published = entry.get('published_parsed')
+        return NewsItem(
+            title=self._sanitize_text(entry.title),
+            summary=self._sanitize_text(entry.get('description', '')),
+            url=entry.get('link', ''),
+            category=category,
+            published=datetime(*published[:6], tzinfo=timezone.utc) if published else None,
+            author=entry.get('author', '연합뉴스'),
+            image_url=self._entry_image_url(entry)
+        )
+        
+    def _entry_image_url(self, entry):
+        """RSS 항목의 썸네일/미디어/첨부 이미지 URL (없으면 None)"""
+        for media in entry.get('media_thumbnail', []) + entry.get('media_content', []):
+            url = media.get('url')
+            if url and (media.get('medium', 'image') == 'image' or media.get('type', '').startswith('image/')):
+                return url
+        for enclosure in entry.get('enclosures', []):
+            if enclosure.get('type', '').startswith('image/') and enclosure.get('href'):
+                return enclosure['href']
+        return None
+        
+    def _prefetch_images(self, news_list):
+        """기사 이미지를 제한된 수의 스레드로 동시에 받아 news_item.image_path에 캐시 경로 저장"""
+        if not self.card_images:
+            return
+        targets = [item for item in news_list if item.image_url and not item.image_path]
+        if not targets:
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        _load_lazy_modules()
+        with ThreadPoolExecutor(max_workers=self.image_fetch_workers) as executor:
+            for item, path in zip(targets, executor.map(self._fetch_image, [t.image_url for t in targets])):
+                item.image_path = path
+        
+        fetched = len([item for item in targets if item.image_path])
+        print(f"[이미지] 기사 이미지 {fetched}/{len(targets)}개 준비")
+        self._trim_image_cache()
+        
+    def _fetch_image(self, url):
+        """기사 이미지를 캐시에서 찾거나 내려받기 (ETag로 재검증, 실패 시 None)"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        image_path = os.path.join(IMAGE_CACHE_DIR, f"{key}.img")
+        meta_path = os.path.join(IMAGE_CACHE_DIR, f"{key}.json")
+        
+        meta = {}
+        if os.path.exists(image_path) and os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except Exception:
+                meta = {}
+        
+        tmp_path = None
+        try:
+            headers = {}
+            if meta.get('url') == url and meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            elif meta.get('url') == url:
+                # ETag가 없는 캐시는 재검증 없이 사용
+                os.utime(image_path)
+                self._count_cache('image', True)
+                return image_path
+            
+            response = self._get_http_session().get(url, headers=headers, timeout=10, stream=True)
+            if response.status_code == 304:
+                os.utime(image_path)
+                self._count_cache('image', True)
+                return image_path
+            response.raise_for_status()
+            self._count_cache('image', False)
+            
+            tmp_path = f"{image_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            size = 0
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(64 * 1024):
+                    size += len(chunk)
+                    if size > self.image_max_download_bytes:
+                        raise Exception("이미지 크기 제한 초과")
+                    f.write(chunk)
+            os.replace(tmp_path, image_path)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'etag': response.headers.get('ETag')}, f)
+            return image_path
+        except Exception as e:
+            print(f"[이미지] 기사 이미지 다운로드 실패 ({url}): {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            # 재검증에 실패해도 이전에 받은 이미지는 사용
+            return image_path if meta.get('url') == url else None
+            
+    def _trim_image_cache(self):
+        """이미지 캐시가 최대 크기를 넘으면 오래 사용하지 않은 파일부터 삭제"""
+        try:
+            entries = []
+            total = 0
+            for name in os.listdir(IMAGE_CACHE_DIR):
+                if not name.endswith('.img'):
+                    continue
+                path = os.path.join(IMAGE_CACHE_DIR, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.image_cache_max_bytes:
+                    break
+                for stale in (path, path[:-4] + '.json'):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+                total -= size
+        except Exception as e:
+            print(f"[이미지] 캐시 정리 실패: {e}")
+    
+    def _dedupe_text(self, item):
+        """유사 기사 비교용 텍스트 (제목 + 요약)"""
+        return f"{item.title} {item.summary}"
+        
+    def _filter_duplicates(self, items, index=None):
+        """유사 기사 중 처음 나온 것만 남김 (index를 넘기면 이전 호출의 기사와도 비교)"""
+        if not self.dedupe_news or not items:
+            return items
+        try:
+            index = index or NearDuplicateIndex(threshold=self.dedupe_threshold)
+            keep = index.add([self._dedupe_text(item) for item in items])
+        except ImportError as e:
+            print(f"[수집] 유사 기사 제거 건너뜀 (numpy 없음): {e}")
+            return items
+        kept = [item for item, flag in zip(items, keep) if flag]
+        if len(kept) < len(items):
+            print(f"[수집] 유사 기사 {len(items) - len(kept)}개 제외")
+        return kept
+        
+    def _is_complete_news(self, item):
+        """제목, 요약(내용), 출처 URL이 모두 비어있지 않은지 확인"""
+        return bool(item.title.strip() and item.summary.strip() and item.url.strip())
+            
+    def collect_news(self, max_per_category=None, total_max=None):
+        """뉴스 수집: RSS.txt 파일에서 RSS URL 읽기 (개수 인자를 주면 RSS.txt 설정 대신 사용)"""
+        try:
+            print("\n=== 1단계: 뉴스 수집 시작 ===")
+            
+            # assets/RSS.txt 파일에서 RSS URL 불러오기
+            rss_urls, default_per_category, default_total = self._load_rss_settings()
+            max_per_category = max_per_category or default_per_category
+            total_max = total_max or default_total
                 
             # 카테고리별 뉴스 수집
             category_news = defaultdict(list)
             
             # 각 RSS 피드에서 뉴스 수집
             for category, rss_url in rss_urls.items():
-                feed = feedparser.parse(rss_url)
+                entries = self._fetch_feed_entries(rss_url)
                 
-                if not feed.entries:
+                if not entries:
                     print(f"[수집] {category} RSS 피드에서 뉴스를 가져올 수 없습니다.")
                     continue
                 
-                for entry in feed.entries:
-                    title = self._sanitize_text(entry.title)
-                    description = self._sanitize_text(entry.get('description', ''))
-                    
-                    news_data = {
-                        "category": f"[{category}]",
-                        "title": f"📌 제목: {title}",
-                        "summary": f"📝 요약:\n{description}",
-                        "source": f"🔗 출처:\n[연합뉴스] {entry.link}",
-                        "author": entry.get('author', '연합뉴스'),
-                        "published": entry.get('published', '')
-                    }
-                    category_news[category].append(news_data)
+                for entry in entries:
+                    item = self._entry_to_news(entry, category)
+                    # 제목, 요약(내용), 출처가 모두 비어있지 않은 경우만 추가
+                    # (유사 기사 제거 전에 걸러야 불완전한 기사가 대표로 남아 기사 전체가 빠지지 않음)
+                    if self._is_complete_news(item):
+                        category_news[category].append(item)
+            
+            # 카테고리를 넘나드는 유사 기사는 개수 제한 전에 대표 1개만 남김
+            flat_news = self._filter_duplicates([item for items in category_news.values() for item in items])
+            kept_ids = {id(item) for item in flat_news}
+            for category in category_news:
+                category_news[category] = [item for item in category_news[category] if id(item) in kept_ids]
             
             news_list = []
             id_counter = 1
@@ -321,22 +1386,18 @@ class NewsProcessor:
             for category in category_news:
                 items = category_news[category][:max_per_category]
                 for item in items:
-                    # 제목, 요약(내용), 출처가 모두 비어있지 않은 경우만 추가
-                    title_text = item.get('title', '').replace('📌 제목: ', '').strip()
-                    summary_text = item.get('summary', '').replace('📝 요약:\n', '').strip()
-                    source_text = item.get('source', '').replace('🔗 출처:\n', '').strip()
-                    if title_text and summary_text and source_text:
-                        item['id'] = id_counter
-                        news_list.append(item)
-                        id_counter += 1
+                    item.id = id_counter
+                    news_list.append(item)
+                    id_counter += 1
             
             # 전체 뉴스 total_max개로 제한
             news_list = news_list[:total_max]
             
             print(f"[수집] 총 {len(news_list)}개 뉴스 수집 완료")
+            self._archive_news(news_list)
             print("\n=== 카테고리별 수집 현황 ===")
             for category in category_news:
-                count = len([news for news in news_list if news['category'] == f'[{category}]'])
+                count = len([news for news in news_list if news.category == category])
                 print(f"{category}: {count}개")
             
             return news_list
@@ -345,86 +1406,187 @@ class NewsProcessor:
             print(f"[수집] 오류 발생: {e}")
             return None
             
+    def _archive_news(self, news_list):
+        """수집한 뉴스를 오늘 날짜 보관 파일에 한 줄씩 추가 (실패해도 수집은 계속)"""
+        try:
+            now = datetime.now()
+            collected_at = now.isoformat(timespec='seconds')
+            os.makedirs(self.news_archive_dir, exist_ok=True)
+            archive_path = os.path.join(self.news_archive_dir, now.strftime("%Y%m%d") + ".jsonl")
+            with open(archive_path, "a", encoding="utf-8") as f:
+                for item in news_list:
+                    record = item.to_dict()
+                    record["collected_at"] = collected_at
+                    record["image_path"] = None  # 이미지 캐시는 정리될 수 있으므로 다시 준비
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._prune_news_archive()
+        except Exception as e:
+            print(f"[수집] 뉴스 보관 실패: {e}")
+            
+    def _news_archive_files(self, days):
+        """최근 days일에 해당하는 날짜별 보관 파일 (오래된 것부터)"""
+        if not os.path.isdir(self.news_archive_dir):
+            return []
+        first_day = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+        return [os.path.join(self.news_archive_dir, name)
+                for name in sorted(os.listdir(self.news_archive_dir))
+                if name.endswith(".jsonl") and name[:-len(".jsonl")] >= first_day]
+                
+    def _prune_news_archive(self):
+        """보관 기간이 지난 날짜 파일 삭제 (오늘 파일에 추가 중인 다른 실행과 겹치지 않음)"""
+        keep = {os.path.basename(path) for path in self._news_archive_files(self.news_archive_days)}
+        for name in os.listdir(self.news_archive_dir):
+            if name.endswith(".jsonl") and name not in keep:
+                try:
+                    os.remove(os.path.join(self.news_archive_dir, name))
+                except OSError:
+                    pass
+                    
+    def _load_news_archive(self, days=7):
+        """최근 days일 동안 보관된 뉴스 (URL 기준 중복 제거, 오래된 것부터)"""
+        cutoff = datetime.now().timestamp() - days * 86400
+        records = {}
+        for archive_path in self._news_archive_files(days):
+            with open(archive_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        collected_at = datetime.fromisoformat(record.pop("collected_at"))
+                    except (ValueError, KeyError):
+                        continue  # 다른 실행이 쓰는 중인 마지막 줄 등
+                    if collected_at.timestamp() < cutoff:
+                        continue
+                    records.pop(record["url"], None)
+                    records[record["url"]] = record
+        return [NewsItem.from_dict(record) for record in records.values()]
+        
+    def _card_layout(self, news_item):
+        """카드 텍스트/기사 이미지 배치 계산 (Pillow 카드와 drawtext 렌더러가 같은 폰트, 위치, 줄바꿈 사용)"""
+        # 1. 텍스트 준비
+        category = f"[{news_item.category}]"
+        title = news_item.title
+        summary = news_item.summary
+        source = f"[연합뉴스] {news_item.url}"
+
+        # 2. 폰트 설정 (현대적이고 가독성 좋은 폰트)
+        card_fonts = self._load_card_fonts()
+        title_font = card_fonts['title']
+        body_font = card_fonts['body']
+        category_font = card_fonts['category']
+        source_font = card_fonts['source']
+
+        # 3. 텍스트 색상 및 배치 좌표 (디자인 전문가 감성)
+        blocks = []
+        padding_x = 80
+        y = 300  # 기존 80 → 300으로 조정 (로고와 겹치지 않게)
+        # 카테고리
+        cat_color = (120, 180, 120, 220)
+        blocks.append({"text": category, "font": category_font, "xy": (padding_x, y), "fill": cat_color, "spacing": 4})
+        y += category_font.size + 40
+
+        # 제목
+        title_max_width = self.WIDTH - 2*padding_x
+        title_wrapped = self._wrap_text(title, title_font, title_max_width)
+        blocks.append({"text": title_wrapped, "font": title_font, "xy": (padding_x, y), "fill": (30, 30, 30, 255), "spacing": 8})
+        y += title_font.size * (title_wrapped.count('\n')+1) + 60
+
+        # 요약
+        summary_max_width = self.WIDTH - 2*padding_x
+        summary_wrapped = self._wrap_text(summary, body_font, summary_max_width)
+        blocks.append({"text": summary_wrapped, "font": body_font, "xy": (padding_x, y), "fill": (60, 60, 60, 255), "spacing": 6})
+        y += body_font.size * (summary_wrapped.count('\n')+1) + 40
+
+        # 출처 (카드 하단에서 120px + 2줄 위)
+        source_max_width = self.WIDTH - 2*padding_x
+        source_wrapped = self._wrap_text(source, source_font, source_max_width)
+        source_y = self.HEIGHT - 120 - (source_font.size * (source_wrapped.count('\n')+1)) - (source_font.size * 2)
+        blocks.append({"text": source_wrapped, "font": source_font, "xy": (padding_x, source_y), "fill": (100, 100, 100, 200), "spacing": 2})
+        
+        # 기사 이미지 (요약과 출처 사이에 공간이 충분할 때만)
+        article_image = None
+        slot_height = min(source_y - 40 - y, self.IMAGE_SLOT_MAX_HEIGHT)
+        if self.card_images and news_item.image_path and slot_height >= self.IMAGE_SLOT_MIN_HEIGHT:
+            article_image = {"path": news_item.image_path, "box": (self.WIDTH - 2*padding_x, slot_height), "y": y}
+        
+        return {"title": title, "blocks": blocks, "article_image": article_image}
+        
     def create_news_image(self, news_item):
         """캔바에서 만든 카드 디자인을 배경으로 사용하고, 텍스트만 예쁘게 배치 (로고와 겹치지 않게)"""
         try:
-            from PIL import Image as PILImage
-            # 1. 캔바에서 만든 카드 배경 이미지 로드
-            template_path = os.path.join('assets', 'card_01_1080x1560.png')
-            if not os.path.exists(template_path):
-                raise Exception(f"카드 템플릿 파일이 없습니다: {template_path}")
-            image = PILImage.open(template_path).convert('RGBA')
+            # 1. 캔바에서 만든 카드 배경 이미지 (한 번만 로드 후 복사 사용)
+            image = self._load_card_template().copy()
             draw = ImageDraw.Draw(image)
 
-            # 2. 텍스트 준비
-            category = news_item['category']
-            title = news_item['title'].replace("📌 제목: ", "")
-            summary = news_item['summary'].replace("📝 요약:\n", "")
-            source = news_item['source'].replace("🔗 출처:\n", "")
+            # 2. 배치 계산 후 그리기
+            layout = self._card_layout(news_item)
+            slot = layout["article_image"]
+            if slot:
+                article_image = self._load_article_image(slot["path"], slot["box"])
+                if article_image:
+                    image.paste(article_image, ((self.WIDTH - article_image.width) // 2, slot["y"]))
+            for block in layout["blocks"]:
+                draw.text(block["xy"], block["text"], font=block["font"], fill=block["fill"], spacing=block["spacing"])
+
+            # 3. 이미지 저장
+            image_filename = f"news_{news_item.id:03d}_{self.run_id}.png"
+            image_path = os.path.join(self.image_output_dir, image_filename)
+            image = image.convert('RGB')
+            image.save(image_path, "PNG", quality=95)
 
-            # 3. 폰트 설정 (현대적이고 가독성 좋은 폰트)
+            return {
+                "path": image_path,
+                "timestamp": self.timestamp,
+                "category": news_item.category,
+                "title": layout["title"]
+            }
+        except Exception as e:
+            print(f"[이미지] 생성 실패 ({news_item.id}): {e}")
+            return None
+            
+    def _load_article_image(self, path, box):
+        """기사 이미지를 box 크기에 맞춰 로드 (JPEG는 draft로 축소 디코딩해 원본 크기로 풀지 않음)"""
+        try:
+            with Image.open(path) as source:
+                source.draft('RGB', box)
+                article_image = source.convert('RGB')
+            article_image.thumbnail(box, Image.LANCZOS)
+            return article_image
+        except Exception as e:
+            print(f"[이미지] 기사 이미지 로드 실패 ({path}): {e}")
+            return None
+            
+    def _load_card_template(self):
+        """카드 배경 템플릿 로드 (최초 1회)"""
+        if self._card_template is None:
+            template_path = os.path.join(self.assets_dir, 'card_01_1080x1560.png')
+            if not os.path.exists(template_path):
+                raise Exception(f"카드 템플릿 파일이 없습니다: {template_path}")
+            with Image.open(template_path) as template:
+                self._card_template = template.convert('RGBA')
+        return self._card_template
+        
+    def _load_card_fonts(self):
+        """카드용 폰트 결정 (최초 1회, 카드용 폰트가 없으면 기본 폰트 사용)"""
+        if self._card_fonts is None:
             font_candidates = [
                 ('C:\\Windows\\Fonts\\NanumSquareRoundB.ttf', 'C:\\Windows\\Fonts\\NanumSquareRoundR.ttf'),
                 ('C:\\Windows\\Fonts\\NotoSansKR-Bold.otf', 'C:\\Windows\\Fonts\\NotoSansKR-Regular.otf'),
                 ('C:\\Windows\\Fonts\\malgunbd.ttf', 'C:\\Windows\\Fonts\\malgun.ttf'),
             ]
-            title_font = self.fonts['title']
-            body_font = self.fonts['body']
-            category_font = self.fonts['category']
-            source_font = self.fonts['source']
+            self._card_fonts = dict(self.fonts)
             for bold_path, regular_path in font_candidates:
                 if os.path.exists(bold_path) and os.path.exists(regular_path):
                     try:
-                        title_font = ImageFont.truetype(bold_path, 60)
-                        body_font = ImageFont.truetype(regular_path, 38)
-                        category_font = ImageFont.truetype(regular_path, 34)
-                        source_font = ImageFont.truetype(regular_path, 30)
+                        self._card_fonts = {
+                            'title': ImageFont.truetype(bold_path, 60),
+                            'body': ImageFont.truetype(regular_path, 38),
+                            'category': ImageFont.truetype(regular_path, 34),
+                            'source': ImageFont.truetype(regular_path, 30)
+                        }
                         break
                     except:
                         pass
-
-            # 4. 텍스트 색상 및 배치 좌표 (디자인 전문가 감성)
-            padding_x = 80
-            y = 300  # 기존 80 → 300으로 조정 (로고와 겹치지 않게)
-            # 카테고리
-            cat_color = (120, 180, 120, 220)
-            cat_text = category
-            draw.text((padding_x, y), cat_text, font=category_font, fill=cat_color)
-            y += category_font.size + 40
-
-            # 제목
-            title_max_width = self.WIDTH - 2*padding_x
-            title_wrapped = self._wrap_text(title, title_font, title_max_width)
-            draw.text((padding_x, y), title_wrapped, font=title_font, fill=(30, 30, 30, 255), spacing=8)
-            y += title_font.size * (title_wrapped.count('\n')+1) + 60
-
-            # 요약
-            summary_max_width = self.WIDTH - 2*padding_x
-            summary_wrapped = self._wrap_text(summary, body_font, summary_max_width)
-            draw.text((padding_x, y), summary_wrapped, font=body_font, fill=(60, 60, 60, 255), spacing=6)
-            y += body_font.size * (summary_wrapped.count('\n')+1) + 40
-
-            # 출처 (카드 하단에서 120px + 2줄 위)
-            source_max_width = self.WIDTH - 2*padding_x
-            source_wrapped = self._wrap_text(source, source_font, source_max_width)
-            source_y = self.HEIGHT - 120 - (source_font.size * (source_wrapped.count('\n')+1)) - (source_font.size * 2)
-            draw.text((padding_x, source_y), source_wrapped, font=source_font, fill=(100, 100, 100, 200), spacing=2)
-
-            # 5. 이미지 저장
-            image_filename = f"news_{news_item['id']:03d}_{self.timestamp}.png"
-            image_path = os.path.join(self.image_output_dir, image_filename)
-            image = image.convert('RGB')
-            image.save(image_path, "PNG", quality=95)
-
-            return {
-                "path": image_path,
-                "timestamp": self.timestamp,
-                "category": news_item['category'],
-                "title": title
-            }
-        except Exception as e:
-            print(f"[이미지] 생성 실패 ({news_item['id']}): {e}")
-            return None
+        return self._card_fonts
             
     def _wrap_text(self, text, font, max_width):
         """텍스트 자동 줄바꿈"""
@@ -458,6 +1620,91 @@ class NewsProcessor:
         
         return '\n'.join(lines)
         
+    def _run_ffmpeg(self, cmd, expected_duration=None, kind="ffmpeg"):
+        """FFmpeg 실행 후 (성공 여부, stderr) 반환
+        expected_duration(초)에 비례한 시간 예산을 넘기거나 진행이 멈추면 강제 종료 후 재시도
+        (kind: 실행 이력에 기록할 작업 종류)"""
+        # 진행 상황을 stdout으로 받아 정체 여부 판단
+        cmd = [cmd[0], "-nostats", "-progress", "pipe:1"] + list(cmd[1:])
+        budget = None
+        if expected_duration:
+            budget = self.ffmpeg_base_timeout + expected_duration * self.ffmpeg_timeout_factor
+        
+        attempts = 1 + self.ffmpeg_retries
+        stderr = ''
+        for attempt in range(1, attempts + 1):
+            started = time.perf_counter()
+            success, stderr, reason, media_seconds = self._supervise_ffmpeg(cmd, budget)
+            self.metrics["encodes"].append((kind, media_seconds, time.perf_counter() - started))
+            if reason is None:
+                return success, stderr
+            print(f"[FFmpeg] {reason}, 강제 종료 ({attempt}/{attempts})")
+        return False, f"{stderr}\n[FFmpeg] 재시도 {self.ffmpeg_retries}회 후에도 완료되지 않아 중단"
+        
+    def _supervise_ffmpeg(self, cmd, budget):
+        """FFmpeg 1회 실행 감시 (반환: (성공 여부, stderr, 강제 종료 사유 또는 None, 출력한 영상 길이(초)))"""
+        # STARTUPINFO 설정 (Windows에서 콘솔 창 숨기기)
+        startupinfo = None
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        
+        # 프로세스 실행 시 encoding 설정
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            startupinfo=startupinfo,
+            encoding='utf-8',
+            errors='replace'
+        )
+        
+        progress = {'last_change': time.monotonic(), 'out_time': -1}
+        stderr_lines = []
+        
+        def read_progress():
+            # out_time_us가 늘어날 때만 진행된 것으로 간주
+            for line in process.stdout:
+                key, _, value = line.strip().partition('=')
+                if key == 'out_time_us':
+                    try:
+                        out_time = int(value)
+                    except ValueError:
+                        continue
+                    if out_time > progress['out_time']:
+                        progress['out_time'] = out_time
+                        progress['last_change'] = time.monotonic()
+        
+        readers = [
+            threading.Thread(target=read_progress, daemon=True),
+            threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        
+        start = time.monotonic()
+        reason = None
+        while True:
+            try:
+                process.wait(timeout=0.5)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            now = time.monotonic()
+            if budget and now - start > budget:
+                reason = f"시간 예산 {budget:.0f}초 초과"
+            elif now - progress['last_change'] > self.ffmpeg_stall_timeout:
+                reason = f"{self.ffmpeg_stall_timeout}초 동안 진행 없음"
+            if reason:
+                process.kill()
+                process.wait()
+                break
+        
+        for reader in readers:
+            reader.join(timeout=5)
+        media_seconds = max(progress['out_time'], 0) / 1_000_000
+        return process.returncode == 0 and reason is None, ''.join(stderr_lines), reason, media_seconds
+        
     def create_video(self, image_info):
         """이미지를 동영상으로 변환"""
         try:
@@ -474,26 +1721,8 @@ class NewsProcessor:
                 video_path
             ]
             
-            # STARTUPINFO 설정 (Windows에서 콘솔 창 숨기기)
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            
-            # 프로세스 실행 시 encoding 설정
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                startupinfo=startupinfo,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            # 출력 읽기
-            stdout, stderr = process.communicate()
-            
-            if process.returncode != 0:
+            success, stderr = self._run_ffmpeg(cmd, expected_duration=self.duration, kind="encode")
+            if not success:
                 print(f"[동영상] FFmpeg 오류: {stderr}")
                 return None
             
@@ -512,6 +1741,163 @@ class NewsProcessor:
             print(f"[동영상] 생성 실패: {e}")
             return None
             
+    def _filter_value(self, value):
+        """FFmpeg 필터 옵션 값 이스케이프 (경로 구분자/콜론/따옴표)"""
+        value = str(value).replace("\\", "/")
+        return "'" + value.replace("'", "'\\''").replace(":", "\\:") + "'"
+        
+    def _drawtext_filter(self, layout, work_dir):
+        """카드 배치를 drawtext 필터 체인으로 변환 (줄마다 Pillow와 같은 좌표에 그림)"""
+        os.makedirs(work_dir, exist_ok=True)
+        filters = []
+        line_no = 0
+        for block in layout["blocks"]:
+            font = block["font"]
+            x, y = block["xy"]
+            ascent = font.getmetrics()[0]
+            # Pillow 여러 줄 간격 = 'A'의 하단 + spacing
+            line_height = font.getbbox("A")[3] + block["spacing"]
+            # Pillow는 RGBA 카드에 알파를 섞지 않고 그린 뒤 RGB로 변환하므로 불투명 색으로 맞춤
+            color = "0x{:02X}{:02X}{:02X}".format(*block["fill"][:3])
+            for idx, line in enumerate(block["text"].split("\n")):
+                if not line.strip():
+                    continue
+                line_no += 1
+                text_path = os.path.join(work_dir, f"line_{line_no:02d}.txt")
+                with open(text_path, "w", encoding="utf-8") as f:
+                    f.write(line)
+                # 기준선(baseline)을 Pillow와 같은 위치(y + ascent)에 맞춤
+                baseline = y + idx * line_height + ascent
+                filters.append(
+                    f"drawtext=fontfile={self._filter_value(font.path)}:textfile={self._filter_value(text_path)}"
+                    f":expansion=none:fontsize={font.size}:fontcolor={color}"
+                    f":x={x}:y={baseline}-max_glyph_a"
+                )
+        return ",".join(filters)
+        
+    def _drawtext_card_graph(self, news_item, work_dir):
+        """템플릿(+기사 이미지) 위에 텍스트를 합성하는 filter_complex와 추가 입력 반환 (출력 라벨 [card])"""
+        layout = self._card_layout(news_item)
+        extra_inputs = []
+        graph = "[0:v]format=rgb24"
+        slot = layout["article_image"]
+        # Pillow 카드와 같은 축소 결과를 넘겨 크기를 맞추고, FFmpeg가 원본을 전체 크기로 디코딩하지 않게 함
+        article_image = self._load_article_image(slot["path"], slot["box"]) if slot else None
+        if article_image:
+            os.makedirs(work_dir, exist_ok=True)
+            article_path = os.path.join(work_dir, "article.png")
+            article_image.save(article_path, "PNG")
+            extra_inputs = ["-i", article_path]
+            graph = f"[0:v][1:v]overlay=x=(main_w-overlay_w)/2:y={slot['y']},format=rgb24"
+        graph += "," + self._drawtext_filter(layout, work_dir) + "[card]"
+        return graph, extra_inputs, layout
+        
+    def create_video_drawtext(self, news_item):
+        """drawtext 렌더러: 카드 PNG 없이 템플릿에 텍스트를 합성하고 같은 줌 효과로 바로 인코딩"""
+        work_dir = os.path.join(self.temp_dir, f"drawtext_{news_item.id:03d}")
+        try:
+            template_path = os.path.join(self.assets_dir, 'card_01_1080x1560.png')
+            # 배치 계산(폰트 측정)만 잠그고 합성/인코딩은 FFmpeg에서 병렬로
+            with self._render_lock:
+                graph, extra_inputs, layout = self._drawtext_card_graph(news_item, work_dir)
+            video_filename = f"news_{news_item.id:03d}_{self.run_id}.mp4"
+            video_path = os.path.join(self.video_output_dir, video_filename)
+            
+            cmd = [
+                self.ffmpeg_path, "-y",
+                "-i", template_path
+            ] + extra_inputs + [
+                "-filter_complex",
+                graph + f";[card]scale=iw*{self.zoom_scale}:-1,zoompan=z='min(zoom+0.0015,1.1)':d={self.duration*25}:s=1080x1920[v]",
+                "-map", "[v]",
+                "-t", str(self.duration),
+                "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                video_path
+            ]
+            
+            success, stderr = self._run_ffmpeg(cmd, expected_duration=self.duration, kind="drawtext")
+            if not success or not os.path.exists(video_path):
+                print(f"[동영상] drawtext 렌더링 실패 ({news_item.id}): {stderr}")
+                return None
+            
+            return {
+                "path": video_path,
+                "timestamp": self.timestamp,
+                "category": news_item.category,
+                "title": layout["title"]
+            }
+        except Exception as e:
+            print(f"[동영상] drawtext 렌더링 실패 ({news_item.id}): {e}")
+            return None
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            
+    def render_drawtext_still(self, news_item, output_path):
+        """drawtext 렌더러로 줌 없이 카드 한 장을 PNG로 저장 (Pillow 결과와 비교용)"""
+        work_dir = os.path.join(self.temp_dir, f"drawtext_still_{news_item.id:03d}")
+        try:
+            with self._render_lock:
+                graph, extra_inputs, _ = self._drawtext_card_graph(news_item, work_dir)
+            cmd = [
+                self.ffmpeg_path, "-y",
+                "-i", os.path.join(self.assets_dir, 'card_01_1080x1560.png')
+            ] + extra_inputs + [
+                "-filter_complex", graph,
+                "-map", "[card]", "-frames:v", "1",
+                output_path
+            ]
+            success, stderr = self._run_ffmpeg(cmd)
+            if not success:
+                print(f"[비교] drawtext 렌더링 실패: {stderr}")
+                return None
+            return output_path
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            
+    def compare_renderers(self, news_list, diff_threshold=48):
+        """Pillow 카드와 drawtext 카드의 픽셀 차이 비교 (카드별 평균 차이, 차이 큰 픽셀 비율, 차이 이미지 저장)"""
+        from PIL import ImageChops, ImageStat
+        
+        results = []
+        for news_item in news_list:
+            pillow_info = self.create_news_image(news_item)
+            still_path = os.path.join(self.image_output_dir, f"drawtext_{news_item.id:03d}_{self.run_id}.png")
+            if not pillow_info or not self.render_drawtext_still(news_item, still_path):
+                continue
+            
+            with Image.open(pillow_info["path"]) as pillow_image, Image.open(still_path) as drawtext_image:
+                diff = ImageChops.difference(pillow_image.convert('RGB'), drawtext_image.convert('RGB'))
+            mean_diff = sum(ImageStat.Stat(diff).mean) / 3
+            gray = diff.convert('L')
+            changed = gray.point(lambda v: 255 if v > diff_threshold else 0).histogram()[255]
+            changed_ratio = changed / (self.WIDTH * self.HEIGHT)
+            diff_path = os.path.join(self.image_output_dir, f"diff_{news_item.id:03d}_{self.run_id}.png")
+            gray.point(lambda v: min(255, v * 4)).save(diff_path)
+            
+            results.append({"id": news_item.id, "mean_diff": mean_diff, "changed_ratio": changed_ratio, "diff_path": diff_path})
+            print(f"[비교] {news_item.id:03d}: 평균 차이 {mean_diff:.2f}, "
+                  f"차이 픽셀 {changed_ratio * 100:.2f}% → {diff_path}")
+        return results
+        
+    def benchmark_renderers(self, news_list):
+        """두 렌더러의 카드당 렌더링+인코딩 시간 비교 (반환: {렌더러: 카드당 평균 초})"""
+        _load_lazy_modules()
+        timings = {}
+        for renderer in ("pillow", "drawtext"):
+            self.renderer = renderer
+            start = time.perf_counter()
+            done = 0
+            for news_item in news_list:
+                video_path = self._render_and_encode(news_item)
+                if video_path:
+                    done += 1
+                    os.remove(video_path)
+            elapsed = time.perf_counter() - start
+            if done:
+                timings[renderer] = elapsed / done
+                print(f"[벤치마크] {renderer}: 카드 {done}개, 카드당 {timings[renderer]:.2f}초")
+        return timings
+        
     def combine_videos(self, video_list):
         """동영상 결합"""
         list_file = None
@@ -527,48 +1913,16 @@ class NewsProcessor:
                     print(f"[결합] 동영상 파일이 없습니다: {video}")
                     return None
             
-            # 동영상 목록 파일 생성 (UTF-8 인코딩 사용)
-            list_file = os.path.join(self.temp_dir, "video_list.txt")
-            with open(list_file, "w", encoding="utf-8") as f:
-                for video in video_list:
-                    # 경로를 UTF-8로 처리하고 역슬래시를 슬래시로 변환
-                    safe_path = os.path.abspath(video).replace("\\", "/")
-                    f.write(f"file '{safe_path}'\n")
-            
-            # STARTUPINFO 설정
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            
             # 결합 파일 경로
-            combined_filename = f"combined_news_{self.timestamp}.mp4"
+            combined_filename = f"combined_news_{self.run_id}.mp4"
             temp_combined = os.path.join(self.temp_dir, f"temp_{combined_filename}")
+            staged_combined = os.path.join(self.temp_dir, combined_filename)
             final_combined = os.path.join(self.video_output_dir, combined_filename)
             
             # 동영상 결합
-            concat_cmd = [
-                self.ffmpeg_path, "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", list_file,
-                "-c", "copy",
-                temp_combined
-            ]
-            
-            # 프로세스 실행
-            process = subprocess.Popen(
-                concat_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                startupinfo=startupinfo,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            stdout, stderr = process.communicate()
-            
-            if process.returncode != 0:
+            list_file = os.path.join(self.temp_dir, "video_list.txt")
+            success, stderr = self._concat_clips(video_list, temp_combined, list_file)
+            if not success:
                 print(f"[결합] FFmpeg 오류: {stderr}")
                 return None
             
@@ -577,44 +1931,12 @@ class NewsProcessor:
                 return None
             
             # 배경음악 추가
-            bgm_path = os.path.join(self.assets_dir, "bgm.mp3")
-            if os.path.exists(bgm_path):
-                total_duration = len(video_list) * self.duration
-                audio_cmd = [
-                    self.ffmpeg_path, "-y",
-                    "-i", temp_combined,
-                    "-ss", "9",
-                    "-i", bgm_path,
-                    "-filter_complex",
-                    f"[1:a]volume=0.352,aloop=loop=-1:size=0,asetpts=N/SR/TB,afade=t=in:st=0:d=1,afade=t=out:st={total_duration-1}:d=1[a]",
-                    "-map", "0:v", "-map", "[a]",
-                    "-shortest",
-                    "-c:v", "copy",
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    final_combined
-                ]
-                
-                process = subprocess.Popen(
-                    audio_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    startupinfo=startupinfo,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-                
-                stdout, stderr = process.communicate()
-                
-                if process.returncode != 0:
-                    print(f"[결합] 배경음악 추가 실패: {stderr}")
-                    shutil.move(temp_combined, final_combined)
-            else:
-                shutil.move(temp_combined, final_combined)
+            self._add_bgm(temp_combined, staged_combined, len(video_list) * self.duration)
             
-            if not os.path.exists(final_combined):
+            if not os.path.exists(staged_combined):
                 print("[결합] 최종 파일이 생성되지 않았습니다.")
                 return None
+            self._publish(staged_combined, final_combined)
             
             print(f"[결합] 동영상 결합 완료: {final_combined}")
             
@@ -635,8 +1957,145 @@ class NewsProcessor:
             except Exception as e:
                 print(f"[결합] 임시 파일 삭제 실패: {e}")
                 
-    def create_metadata(self, news_list, combined_path):
-        """메타데이터 생성"""
+    def _concat_clips(self, video_list, output_path, list_file):
+        """concat demuxer로 재인코딩 없이 클립 결합 (반환: (성공 여부, stderr))"""
+        # 동영상 목록 파일 생성 (UTF-8 인코딩 사용)
+        with open(list_file, "w", encoding="utf-8") as f:
+            for video in video_list:
+                # 경로를 UTF-8로 처리하고 역슬래시를 슬래시로 변환
+                safe_path = os.path.abspath(video).replace("\\", "/")
+                f.write(f"file '{safe_path}'\n")
+        
+        concat_cmd = [
+            self.ffmpeg_path, "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", list_file,
+            "-c", "copy",
+            output_path
+        ]
+        return self._run_ffmpeg(concat_cmd, expected_duration=len(video_list) * self.duration, kind="concat")
+        
+    def _add_bgm(self, video_path, output_path, total_duration):
+        """배경음악을 입혀 output_path로 저장 (배경음악이 없거나 실패하면 원본을 그대로 이동)"""
+        bgm_path = os.path.join(self.assets_dir, "bgm.mp3")
+        if os.path.exists(bgm_path):
+            audio_cmd = [
+                self.ffmpeg_path, "-y",
+                "-i", video_path,
+                "-ss", "9",
+                "-i", bgm_path,
+                "-filter_complex",
+                f"[1:a]{self._bgm_filter(total_duration)}[a]",
+                "-map", "0:v", "-map", "[a]",
+                "-shortest",
+                "-c:v", "copy",
+                "-c:a", "aac",
+                "-b:a", "192k",
+                output_path
+            ]
+            
+            success, stderr = self._run_ffmpeg(audio_cmd, expected_duration=total_duration, kind="bgm")
+            if success:
+                return
+            print(f"[결합] 배경음악 추가 실패: {stderr}")
+        shutil.move(video_path, output_path)
+        
+    def _bgm_filter(self, total_duration):
+        """배경음악 필터 (반복 재생, 시작/끝 페이드)"""
+        return (f"volume=0.352,aloop=loop=-1:size=0,asetpts=N/SR/TB,"
+                f"afade=t=in:st=0:d=1,afade=t=out:st={total_duration-1}:d=1")
+        
+    def create_multi_format_videos(self, image_list, formats):
+        """카드 이미지를 한 번만 디코딩/줌 처리한 뒤 split 하여
+        여러 화면비(shorts/square/landscape)를 FFmpeg 한 번으로 인코딩 (반환: {포맷: 경로})"""
+        try:
+            if not image_list:
+                print("[멀티포맷] 변환할 이미지가 없습니다.")
+                return None
+            formats = [fmt for fmt in formats if fmt in self.OUTPUT_FORMATS]
+            if not formats:
+                print("[멀티포맷] 지원하는 출력 포맷이 없습니다.")
+                return None
+            
+            cmd = [self.ffmpeg_path, "-y"]
+            for image_path in image_list:
+                cmd += ["-i", image_path]
+            
+            # 1. 카드별 줌 효과 (create_video와 동일) 후 하나로 연결
+            frames = self.duration * 25
+            filters = []
+            for idx in range(len(image_list)):
+                filters.append(
+                    f"[{idx}:v]scale=iw*{self.zoom_scale}:-1,"
+                    f"zoompan=z='min(zoom+0.0015,1.1)':d={frames}:s=1080x1920,"
+                    f"trim=end_frame={frames},setpts=PTS-STARTPTS[c{idx}]"
+                )
+            filters.append("".join(f"[c{idx}]" for idx in range(len(image_list)))
+                           + f"concat=n={len(image_list)}:v=1:a=0[base]")
+            
+            # 2. 포맷별로 분기: shorts는 그대로, 나머지는 카드 원래 비율로 되돌린 뒤 맞춰서 여백 채움
+            filters.append(f"[base]split={len(formats)}" + "".join(f"[s{i}]" for i in range(len(formats))))
+            pad_color = "0x{:02X}{:02X}{:02X}".format(*self.BG_COLOR)
+            for i, fmt in enumerate(formats):
+                width, height = self.OUTPUT_FORMATS[fmt]
+                if (width, height) == (1080, 1920):
+                    filters.append(f"[s{i}]format=yuv420p[v{i}]")
+                else:
+                    filters.append(
+                        f"[s{i}]scale={self.WIDTH}:{self.HEIGHT},setsar=1,"
+                        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:color={pad_color},"
+                        f"format=yuv420p[v{i}]"
+                    )
+            
+            # 3. 배경음악도 한 번만 디코딩해서 포맷 수만큼 분기
+            total_duration = len(image_list) * self.duration
+            bgm_path = os.path.join(self.assets_dir, "bgm.mp3")
+            has_bgm = os.path.exists(bgm_path)
+            if has_bgm:
+                cmd += ["-ss", "9", "-i", bgm_path]
+                filters.append(
+                    f"[{len(image_list)}:a]{self._bgm_filter(total_duration)},"
+                    f"atrim=duration={total_duration},asplit={len(formats)}"
+                    + "".join(f"[a{i}]" for i in range(len(formats)))
+                )
+            cmd += ["-filter_complex", ";".join(filters)]
+            
+            outputs = {}
+            for i, fmt in enumerate(formats):
+                if fmt == "shorts":
+                    filename = f"combined_news_{self.run_id}.mp4"
+                else:
+                    filename = f"{fmt}_news_{self.run_id}.mp4"
+                outputs[fmt] = os.path.join(self.temp_dir, filename)
+                cmd += ["-map", f"[v{i}]"]
+                if has_bgm:
+                    cmd += ["-map", f"[a{i}]", "-c:a", "aac", "-b:a", "192k"]
+                cmd += ["-c:v", "libx264", "-pix_fmt", "yuv420p",
+                        "-t", str(total_duration), outputs[fmt]]
+            
+            success, stderr = self._run_ffmpeg(cmd, expected_duration=total_duration * len(formats), kind="multi_format")
+            if not success:
+                print(f"[멀티포맷] FFmpeg 오류: {stderr}")
+                return None
+            
+            for fmt, path in outputs.items():
+                if not os.path.exists(path):
+                    print(f"[멀티포맷] 생성 실패: {fmt}")
+                    return None
+            for fmt, path in outputs.items():
+                outputs[fmt] = self._publish(path, os.path.join(self.video_output_dir, os.path.basename(path)))
+                print(f"[멀티포맷] {fmt} ({'x'.join(map(str, self.OUTPUT_FORMATS[fmt]))}): {outputs[fmt]}")
+            
+            return outputs
+            
+        except Exception as e:
+            print(f"[멀티포맷] 실패: {e}")
+            return None
+            
+    def create_metadata(self, news_list, combined_path, variant=None):
+        """메타데이터 생성 (variant: 멀티 포맷 출력 시 포맷명)"""
         try:
             if not os.path.exists(combined_path):
                 print(f"[메타데이터] 결합된 동영상 파일이 없습니다: {combined_path}")
@@ -649,8 +2108,7 @@ class NewsProcessor:
             # 포함된 카테고리 추출
             category_news = defaultdict(list)
             for news in news_list:
-                category = news["category"].strip("[]")
-                category_news[category].append(news)
+                category_news[news.category].append(news)
             
             # 포함된 카테고리 추출
             included_categories = list(category_news.keys())
@@ -686,6 +2144,7 @@ class NewsProcessor:
             title = f"{date_str} " + " ".join([f"#{cat} News" for cat in included_categories])
             if coupang_notice:
                 title += f"   {coupang_notice}"
+            title = title[:YOUTUBE_TITLE_MAX]
             
 
             # 설명 생성 (카테고리 부분을 #카테고리 News 형태로)
@@ -696,13 +2155,24 @@ class NewsProcessor:
             if coupang_link:
                 description += f"{coupang_link}\n\n"
             description += f"=== 오늘의 {'/'.join(included_categories)} 뉴스 ===\n"
+            # 뉴스 목록은 설명 한도 안에서만 넣고 나머지는 개수로 표시 (롱폼은 수백 건)
+            size = len(description.encode('utf-8'))
+            budget = YOUTUBE_DESCRIPTION_MAX_BYTES - 100
+            omitted = 0
             for category, news_items in category_news.items():
-                if news_items:
-                    description += f"\n[{category}]\n"
-                    for news in news_items:
-                        title_text = news["title"].replace("📌 제목: ", "")
-                        url = news["source"].split("\n")[1].split(" ")[1]
-                        description += f"- {title_text}\n  {url}\n"
+                section = f"\n[{category}]\n"
+                for news in news_items:
+                    # YouTube는 설명에 꺾쇠괄호를 허용하지 않음
+                    line = f"- {news.title}\n  {news.url}\n".replace('<', '').replace('>', '')
+                    line_size = len((section + line).encode('utf-8'))
+                    if size + line_size > budget:
+                        omitted += 1
+                        continue
+                    description += section + line
+                    size += line_size
+                    section = ""
+            if omitted:
+                description += f"\n... 외 {omitted}건\n"
 
             # 태그 생성 (SEO 최적화 & 유튜브 정책 준수)
             tags = []
@@ -784,13 +2254,17 @@ class NewsProcessor:
                 "news_segments": []
             }
             
-            metadata_path = os.path.join(
-                self.video_output_dir, 
-                f"video_metadata_{self.timestamp}.json"
-            )
+            metadata_filename = f"video_metadata_{self.run_id}.json"
+            if variant:
+                width, height = self.OUTPUT_FORMATS.get(variant, self.OUTPUT_FORMATS["shorts"])
+                metadata["format"] = variant
+                metadata["resolution"] = f"{width}x{height}"
+                metadata_filename = f"video_metadata_{self.run_id}_{variant}.json"
             
-            with open(metadata_path, "w", encoding="utf-8") as f:
+            staged_path = os.path.join(self.temp_dir, metadata_filename)
+            with open(staged_path, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, ensure_ascii=False, indent=2)
+            metadata_path = self._publish(staged_path, os.path.join(self.video_output_dir, metadata_filename))
             
             print(f"[메타데이터] 저장 완료: {metadata_path}")
             
@@ -810,33 +2284,543 @@ class NewsProcessor:
             print(f"[메타데이터] 생성 실패: {e}")
             return None
             
-    def process(self):
-        """전체 처리 과정"""
+    def _assemble(self, news_list, video_files):
+        """동영상 결합 → 메타데이터 생성 → 디렉토리 정리 (성공 시 (결합 파일, 메타데이터) 반환)"""
+        # 4. 동영상 결합
+        print("\n=== 4단계: 동영상 결합 시작 ===")
+        combined_path = self.combine_videos(video_files)
+        self._mark_stage("combine")
+        if not combined_path:
+            print("[처리] 동영상 결합 실패")
+            return None
+        
+        # 5. 메타데이터 생성
+        print("\n=== 5단계: 메타데이터 생성 시작 ===")
+        metadata_path = self.create_metadata(news_list, combined_path)
+        self._mark_stage("metadata")
+        if not metadata_path:
+            print("[처리] 메타데이터 생성 실패")
+            return None
+        self.metrics["cards"] = len(video_files)
+        self._register_run([{"format": "shorts", "video": combined_path, "metadata": metadata_path}])
+        
+        # 6. 디렉토리 정리
+        self._cleanup_old_directories(self.images_dir)
+        self._cleanup_old_directories(self.videos_dir)
+        
+        return combined_path, metadata_path
+        
+    def _render_and_encode(self, news_item, keep_image=True):
+        """뉴스 1건을 카드 이미지 → 동영상 클립으로 변환 (실패 시 None)"""
+        if self.renderer == "drawtext":
+            video_info = self.create_video_drawtext(news_item)
+            return video_info["path"] if video_info else None
+        
+        # 폰트 객체는 스레드 간 공유하므로 그리기는 한 번에 하나씩, 인코딩만 병렬로
+        with self._render_lock:
+            image_info = self.create_news_image(news_item)
+        if not image_info:
+            return None
+        video_info = self.create_video(image_info)
+        if not keep_image and os.path.exists(image_info["path"]):
+            os.remove(image_info["path"])
+        if not video_info:
+            return None
+        return video_info["path"]
+        
+    def _poll_new_news(self, rss_urls, max_per_category, seen_links):
+        """피드를 확인해 처음 보는 뉴스만 반환
+        (seen_links: {링크: 마지막으로 피드에서 본 시각}, 피드에서 빠진 지 오래된 링크는 삭제)"""
+        new_items = []
+        now = time.time()
+        for category, rss_url in rss_urls.items():
+            count = 0
+            for entry in self._fetch_feed_entries(rss_url):
+                link = entry.get('link')
+                if not link:
+                    continue
+                is_new = link not in seen_links
+                seen_links[link] = now
+                if not is_new:
+                    continue
+                item = self._entry_to_news(entry, category)
+                if self._is_complete_news(item) and count < max_per_category:
+                    new_items.append(item)
+                    count += 1
+        
+        # 피드에 계속 남아 있는 링크는 위에서 갱신되므로 오래된 링크만 빠짐
+        for link, last_seen in list(seen_links.items()):
+            if now - last_seen > self.watch_link_ttl:
+                del seen_links[link]
+        
+        # 상주 모드에서는 색인을 유지해 이전에 처리한 기사와도 비교
+        if self.dedupe_news and self._dedupe_index is None:
+            try:
+                self._dedupe_index = NearDuplicateIndex(threshold=self.dedupe_threshold)
+            except ImportError:
+                pass
+        return self._filter_duplicates(new_items, self._dedupe_index)
+        
+    def watch(self, interval=300, build_every=None, build_times=None, max_builds=None):
+        """상주 모드: 피드를 주기적으로 확인해 새 뉴스를 바로 카드/클립으로 만들고,
+        예약 시각(HH:MM) 또는 새 클립이 build_every개 모이면 최종 동영상을 결합"""
+        rss_urls, max_per_category, total_max = self._load_rss_settings()
+        build_every = build_every or total_max
+        build_times = sorted({normalize_build_time(t) for t in build_times or []})
+        
+        print("\n=== 상주 모드 시작 ===")
+        print(f"- 확인 주기: {interval}초, 결합 기준: 새 뉴스 {build_every}개"
+              + (f" 또는 {', '.join(build_times)}" if build_times else ""))
+        
+        # 폰트, 템플릿, HTTP 세션은 한 번만 준비해서 계속 사용
+        self._load_card_template()
+        self._load_card_fonts()
+        self._get_http_session()
+        
+        seen_links = {}
+        watch_day = datetime.now().date()
+        pending = []  # (뉴스, 클립 경로)
+        in_flight = {}
+        next_id = 1
+        builds = 0
+        last_slot = None
+        
+        from concurrent.futures import ThreadPoolExecutor, wait
+        
+        _load_lazy_modules()
+        executor = ThreadPoolExecutor(max_workers=self.watch_workers)
+        try:
+            while max_builds is None or builds < max_builds:
+                # 날짜가 바뀌면 유사 기사 색인을 새로 시작 (전날 기사와 비슷하다는 이유로 계속 제외하지 않게)
+                if datetime.now().date() != watch_day:
+                    watch_day = datetime.now().date()
+                    self._dedupe_index = None
+                
+                # 1. 새 뉴스 확인 후 바로 렌더링/인코딩 작업 등록
+                try:
+                    new_items = self._poll_new_news(rss_urls, max_per_category, seen_links)
+                except Exception as e:
+                    print(f"[상주] 피드 확인 실패: {e}")
+                    new_items = []
+                self._prefetch_images(new_items)
+                self._archive_news(new_items)
+                for item in new_items:
+                    item.id = next_id
+                    next_id += 1
+                    in_flight[executor.submit(self._render_and_encode, item)] = item
+                if new_items:
+                    print(f"[상주] 새 뉴스 {len(new_items)}개 처리 시작")
+                
+                # 2. 완료된 클립 수거
+                for future in [f for f in in_flight if f.done()]:
+                    item = in_flight.pop(future)
+                    video_path = future.result()
+                    if video_path:
+                        pending.append((item, video_path))
+                
+                # 3. 결합 시점 판단
+                now = datetime.now()
+                slot = next((t for t in reversed(build_times) if now.strftime('%H:%M') >= t), None)
+                slot_key = (now.date(), slot) if slot else None
+                scheduled = slot_key is not None and last_slot is not None and slot_key != last_slot
+                if last_slot is None:
+                    last_slot = slot_key or (now.date(), None)
+                
+                if scheduled or len(pending) + len(in_flight) >= build_every:
+                    # 진행 중인 작업을 마친 뒤 이미 만들어진 클립만 결합
+                    wait(list(in_flight))
+                    for future, item in list(in_flight.items()):
+                        video_path = future.result()
+                        if video_path:
+                            pending.append((item, video_path))
+                    in_flight.clear()
+                    last_slot = slot_key or last_slot
+                    
+                    if pending:
+                        # 최신 뉴스 total_max개만 사용, 나머지 클립은 삭제
+                        dropped, pending = pending[:-total_max], pending[-total_max:]
+                        for _, video_path in dropped:
+                            if os.path.exists(video_path):
+                                os.remove(video_path)
+                        print(f"\n[상주] 클립 {len(pending)}개로 동영상 결합")
+                        # 상주 모드의 렌더링 시간은 피드 대기와 섞이므로 결합 이후만 측정
+                        self.metrics["started"] = self.metrics["clock"] = time.perf_counter()
+                        assembled = self._assemble([item for item, _ in pending],
+                                                   [path for _, path in pending])
+                        if assembled:
+                            builds += 1
+                        pending = []
+                        self._record_run("watch", bool(assembled))
+                        # 빌드 단위마다 새 실행 ID와 작업 공간 사용
+                        self._finish_run()
+                        self._start_run()
+                    if max_builds is not None and builds >= max_builds:
+                        break
+                
+                # 4. 다음 확인 또는 다음 예약 시각까지 대기
+                self._touch_run()
+                sleep_for = interval
+                for t in build_times:
+                    target = datetime.combine(now.date(), datetime.strptime(t, '%H:%M').time())
+                    if target > now:
+                        sleep_for = min(sleep_for, (target - now).total_seconds() + 1)
+                        break
+                time.sleep(max(1, sleep_for))
+        except KeyboardInterrupt:
+            print("\n[상주] 종료 요청")
+        finally:
+            executor.shutdown(wait=True)
+            self._finish_run()
+        
+        return builds
+            
+    def _process_multi_format(self, news_list, image_results, formats):
+        """멀티 포맷 처리: 단일 FFmpeg 실행으로 포맷별 동영상과 메타데이터 생성"""
+        print(f"\n=== 3~4단계: 멀티 포맷 동영상 생성 ({', '.join(formats)}) ===")
+        outputs = self.create_multi_format_videos(
+            [result["image_info"]["path"] for result in image_results], formats
+        )
+        self._mark_stage("videos")
+        if not outputs:
+            print("[처리] 멀티 포맷 동영상 생성 실패")
+            return False
+        
+        print("\n=== 5단계: 메타데이터 생성 시작 ===")
+        rendered_news = [result["news_data"] for result in image_results]
+        registered = []
+        for fmt, path in outputs.items():
+            metadata_path = self.create_metadata(rendered_news, path, variant=fmt)
+            if not metadata_path:
+                print(f"[처리] 메타데이터 생성 실패: {fmt}")
+                return False
+            registered.append({"format": fmt, "video": path, "metadata": metadata_path})
+        self._mark_stage("metadata")
+        self.metrics["cards"] = len(image_results)
+        self._register_run(registered)
+        
+        self._cleanup_old_directories(self.images_dir)
+        self._cleanup_old_directories(self.videos_dir)
+        
+        print("\n=== 처리 완료 ===")
+        print(f"- 처리된 뉴스: {len(news_list)}개")
+        print(f"- 생성된 이미지: {len(image_results)}개")
+        for fmt, path in outputs.items():
+            print(f"- {fmt}: {os.path.basename(path)}")
+        return True
+        
+    def process_long_form(self, max_cards=300, group_size=32, days=7):
+        """롱폼 모드: 최근 days일 동안 수집·보관한 뉴스 중 최신 max_cards개를
+        클립으로 만들면서 바로 트리 결합 (카드 이미지와 중간 클립은 결합 즉시 삭제해 디스크 사용량 제한)"""
+        return self._run_recorded("longform", self._process_long_form, max_cards, group_size, days)
+        
+    def _process_long_form(self, max_cards, group_size, days):
+        try:
+            # 지금 피드에 있는 뉴스도 보관 파일에 추가한 뒤 기간 전체에서 선택
+            self.news_archive_days = max(self.news_archive_days, days)
+            current = self.collect_news(max_per_category=max_cards, total_max=max_cards) or []
+            news_list = self._filter_duplicates(self._load_news_archive(days)) or current
+            news_list = news_list[-max_cards:]
+            for news_id, item in enumerate(news_list, 1):
+                item.id = news_id
+            self._mark_stage("collect")
+            if not news_list:
+                print("[롱폼] 뉴스 수집 실패")
+                return False
+            print(f"[롱폼] 최근 {days}일 보관 뉴스 중 {len(news_list)}개 사용")
+            
+            print(f"\n=== 2~3단계: 롱폼 카드/클립 생성 및 결합 ({len(news_list)}개, {group_size}개 단위) ===")
+            tree = ConcatTree(self, os.path.join(self.temp_dir, "longform"), group_size)
+            rendered_news = []
+            from concurrent.futures import ThreadPoolExecutor
+            
+            _load_lazy_modules()
+            with ThreadPoolExecutor(max_workers=self.watch_workers) as executor:
+                # 한 번에 일부만 처리해 결합 대기 중인 클립 수를 제한
+                batch_size = self.watch_workers * 2
+                for start in range(0, len(news_list), batch_size):
+                    batch = news_list[start:start + batch_size]
+                    self._prefetch_images(batch)
+                    results = executor.map(lambda item: self._render_and_encode(item, keep_image=False), batch)
+                    for news_item, video_path in zip(batch, results):
+                        if not video_path:
+                            continue
+                        tree.add(video_path)
+                        rendered_news.append(news_item)
+                    print(f"[롱폼] {min(start + batch_size, len(news_list))}/{len(news_list)} 처리")
+            
+            merged = tree.finish()
+            self._mark_stage("render")
+            if not merged:
+                print("[롱폼] 결합할 동영상이 없습니다.")
+                return False
+            
+            print("\n=== 4단계: 배경음악 추가 ===")
+            final_filename = f"longform_news_{self.run_id}.mp4"
+            staged_path = os.path.join(self.temp_dir, final_filename)
+            self._add_bgm(merged, staged_path, tree.clip_count * self.duration)
+            shutil.rmtree(tree.work_dir, ignore_errors=True)
+            if not os.path.exists(staged_path):
+                print("[롱폼] 최종 파일이 생성되지 않았습니다.")
+                return False
+            final_path = self._publish(staged_path, os.path.join(self.video_output_dir, final_filename))
+            self._mark_stage("bgm")
+            
+            print("\n=== 5단계: 메타데이터 생성 시작 ===")
+            metadata_path = self.create_metadata(rendered_news, final_path, variant="longform")
+            if not metadata_path:
+                print("[롱폼] 메타데이터 생성 실패")
+                return False
+            self.metrics["cards"] = tree.clip_count
+            self._register_run([{"format": "longform", "video": final_path, "metadata": metadata_path}])
+            
+            self._cleanup_old_directories(self.images_dir)
+            self._cleanup_old_directories(self.videos_dir)
+            
+            print("\n=== 롱폼 처리 완료 ===")
+            print(f"- 결합된 카드: {tree.clip_count}개")
+            print(f"- 동영상: {os.path.basename(final_path)}")
+            print(f"- 메타데이터: {os.path.basename(metadata_path)}")
+            return True
+            
+        except Exception as e:
+            print(f"[롱폼] 오류 발생: {e}")
+            return False
+        finally:
+            self._finish_run()
+            
+    def _process_drawtext(self, news_list):
+        """drawtext 렌더러 처리: 카드 PNG 없이 뉴스별 클립을 바로 인코딩한 뒤 결합"""
+        print("\n=== 2~3단계: drawtext 렌더링/동영상 생성 시작 ===")
+        self._prefetch_images(news_list)
+        video_files = []
+        rendered_news = []
+        for news_item in news_list:
+            video_info = self.create_video_drawtext(news_item)
+            if video_info:
+                video_files.append(video_info["path"])
+                rendered_news.append(news_item)
+        self._mark_stage("videos")
+        
+        if not video_files:
+            print("[처리] 동영상 생성 실패")
+            return False
+        print(f"[처리] {len(video_files)}개의 동영상 생성 완료")
+        
+        assembled = self._assemble(rendered_news, video_files)
+        if not assembled:
+            return False
+        combined_path, metadata_path = assembled
+        
+        print("\n=== 처리 완료 ===")
+        print(f"- 처리된 뉴스: {len(news_list)}개")
+        print(f"- 생성된 동영상: {len(video_files)}개")
+        print(f"- 결합된 동영상: {os.path.basename(combined_path)}")
+        print(f"- 메타데이터: {os.path.basename(metadata_path)}")
+        return True
+        
+    def process_coordinator(self, queue_dir, timeout=1800):
+        """작업 큐 코디네이터: 뉴스를 수집해 카드 작업을 큐에 넣고,
+        워커들이 모두 끝내면(또는 timeout초가 지나면) 완료된 클립을 결합"""
+        return self._run_recorded("coordinator", self._process_coordinator, queue_dir, timeout)
+        
+    def _process_coordinator(self, queue_dir, timeout):
+        try:
+            news_list = self.collect_news()
+            self._mark_stage("collect")
+            if not news_list:
+                print("[큐] 뉴스 수집 실패")
+                return False
+            
+            print(f"\n=== 2~3단계: 작업 큐로 카드/동영상 생성 ({queue_dir}) ===")
+            queue = WorkQueue(queue_dir, lease_timeout=self.queue_lease_timeout)
+            queue.purge_stale()
+            settings = {"renderer": self.renderer, "card_images": self.card_images}
+            job_ids = []
+            for item in news_list:
+                job_id = f"{self.run_id}_{item.id:03d}"
+                queue.enqueue({"job_id": job_id, "batch": self.run_id, "item": item.to_dict(), "settings": settings})
+                job_ids.append(job_id)
+            print(f"[큐] 작업 {len(job_ids)}개 등록, 워커 대기 중")
+            
+            deadline = time.monotonic() + timeout
+            finished = 0
+            while True:
+                queue.requeue_expired()
+                results = queue.results(job_ids)
+                if len(results) != finished:
+                    finished = len(results)
+                    print(f"[큐] {finished}/{len(job_ids)} 완료")
+                if finished == len(job_ids):
+                    break
+                if time.monotonic() > deadline:
+                    print(f"[큐] 대기 시간 초과, 완료된 {finished}개로 진행")
+                    break
+                time.sleep(self.queue_poll_interval)
+            self._mark_stage("videos")
+            
+            # 큐 디렉토리가 호스트마다 다른 경로에 마운트될 수 있어 클립 경로는 큐 기준 상대 경로로 주고받음
+            video_files = []
+            rendered_news = []
+            for item, job_id in zip(news_list, job_ids):
+                state, job = results.get(job_id, (None, None))
+                if state != 'done':
+                    if state == 'failed':
+                        print(f"[큐] 작업 실패 ({job_id}): {job.get('error')}")
+                    continue
+                clip_path = os.path.join(queue_dir, job['result']['clip'])
+                if os.path.exists(clip_path):
+                    video_files.append(clip_path)
+                    rendered_news.append(item)
+            
+            if not video_files:
+                print("[큐] 완료된 클립이 없습니다.")
+                queue.discard(job_ids, self.run_id)
+                return False
+            
+            assembled = self._assemble(rendered_news, video_files)
+            queue.discard(job_ids, self.run_id)
+            if not assembled:
+                return False
+            combined_path, metadata_path = assembled
+            
+            print("\n=== 처리 완료 ===")
+            print(f"- 처리된 뉴스: {len(news_list)}개")
+            print(f"- 생성된 동영상: {len(video_files)}개")
+            print(f"- 결합된 동영상: {os.path.basename(combined_path)}")
+            print(f"- 메타데이터: {os.path.basename(metadata_path)}")
+            return True
+            
+        except Exception as e:
+            print(f"[큐] 오류 발생: {e}")
+            return False
+        finally:
+            self._finish_run()
+            
+    def run_worker(self, queue_dir, idle_exit=None):
+        """작업 큐 워커: 작업을 선점해 카드/클립을 만들고 클립을 큐 디렉토리로 올림
+        (idle_exit초 동안 작업이 없으면 종료, None이면 계속 대기)"""
+        queue = WorkQueue(queue_dir, lease_timeout=self.queue_lease_timeout)
+        processed = 0
+        idle_since = time.monotonic()
+        print(f"[워커] {platform.node()} 작업 대기: {queue_dir}")
+        try:
+            while True:
+                job = queue.claim()
+                if job is None:
+                    queue.requeue_expired()
+                    if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                        break
+                    time.sleep(self.queue_poll_interval)
+                    continue
+                self._run_job(queue, job)
+                processed += 1
+                idle_since = time.monotonic()
+        except KeyboardInterrupt:
+            print("\n[워커] 종료 요청")
+        finally:
+            self._finish_run()
+            # 클립은 큐로 옮겼으므로 빈 실행 디렉토리는 남기지 않음 (정리 대상 개수 보존)
+            for path in (self.image_output_dir, self.video_output_dir):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass
+        print(f"[워커] 작업 {processed}개 처리 후 종료")
+        return processed
+        
+    def _run_job(self, queue, job):
+        """작업 1건 처리 (처리하는 동안 별도 스레드가 임대 갱신)"""
+        job_id = job['job_id']
+        stop = threading.Event()
+        lost = threading.Event()
+        
+        def heartbeat():
+            while not stop.wait(queue.lease_timeout / 3):
+                if not queue.heartbeat(job):
+                    print(f"[워커] 임대를 잃었습니다: {job_id}")
+                    lost.set()
+                    break
+        
+        threading.Thread(target=heartbeat, daemon=True).start()
+        try:
+            item = NewsItem.from_dict(job['item'])
+            settings = job.get('settings', {})
+            self.renderer = settings.get('renderer', self.renderer)
+            self.card_images = settings.get('card_images', self.card_images)
+            if self.card_images:
+                self._prefetch_images([item])
+            
+            video_path = self._render_and_encode(item, keep_image=False)
+            if lost.is_set():
+                # 다른 워커가 이미 다시 가져갔으므로 결과를 버림
+                if video_path and os.path.exists(video_path):
+                    os.remove(video_path)
+                print(f"[워커] 임대 만료로 결과 폐기: {job_id}")
+                return
+            if not video_path:
+                raise RuntimeError("클립 생성 실패")
+            # 임대마다 다른 파일 이름을 써서 늦게 끝난 워커가 다른 워커의 클립을 덮어쓰지 않게 함
+            clip = os.path.join('clips', job['batch'], f"{job_id}.{job['lease']}.mp4")
+            os.makedirs(os.path.join(queue.root, 'clips', job['batch']), exist_ok=True)
+            self._publish(video_path, os.path.join(queue.root, clip))
+            if queue.complete(job, {"clip": clip.replace("\\", "/"), "worker": platform.node()}):
+                print(f"[워커] 완료: {job_id}")
+            else:
+                os.remove(os.path.join(queue.root, clip))
+                print(f"[워커] 임대 만료로 결과 폐기: {job_id}")
+        except Exception as e:
+            print(f"[워커] 실패 ({job_id}): {e}")
+            if not queue.fail(job, e):
+                print(f"[워커] 임대 만료로 실패 기록 생략: {job_id}")
+        finally:
+            stop.set()
+            
+    def process(self, formats=None):
+        """전체 처리 과정 (formats: 멀티 포맷 출력 목록, 없으면 기존 단일 Shorts 출력)"""
+        if formats:
+            mode = "multi_format"
+        else:
+            mode = "drawtext" if self.renderer == "drawtext" else "daily"
+        return self._run_recorded(mode, self._process, formats)
+        
+    def _process(self, formats):
         try:
             # 1. 뉴스 수집
             news_list = self.collect_news()
+            self._mark_stage("collect")
             if not news_list:
                 print("[처리] 뉴스 수집 실패")
                 return False
             
+            if self.renderer == "drawtext":
+                if formats:
+                    print("[처리] 멀티 포맷 출력은 카드 이미지가 필요하므로 Pillow 렌더러를 사용합니다.")
+                else:
+                    return self._process_drawtext(news_list)
+            
             # 2. 이미지 생성
             print("\n=== 2단계: 이미지 생성 시작 ===")
+            self._prefetch_images(news_list)
             image_results = []
             for news_item in news_list:
                 image_info = self.create_news_image(news_item)
                 if image_info:
                     image_results.append({
-                        "news_id": news_item["id"],
+                        "news_id": news_item.id,
                         "image_info": image_info,
                         "news_data": news_item
                     })
             
+            self._mark_stage("images")
             if not image_results:
                 print("[처리] 이미지 생성 실패")
                 return False
                 
             print(f"[처리] {len(image_results)}개의 이미지 생성 완료")
             
+            if formats:
+                return self._process_multi_format(news_list, image_results, formats)
+            
             # 3. 동영상 생성
             print("\n=== 3단계: 동영상 생성 시작 ===")
             video_files = []
@@ -844,6 +2828,7 @@ class NewsProcessor:
                 video_info = self.create_video(result["image_info"])
                 if video_info:
                     video_files.append(video_info["path"])
+            self._mark_stage("videos")
             
             if not video_files:
                 print("[처리] 동영상 생성 실패")
@@ -851,23 +2836,11 @@ class NewsProcessor:
                 
             print(f"[처리] {len(video_files)}개의 동영상 생성 완료")
             
-            # 4. 동영상 결합
-            print("\n=== 4단계: 동영상 결합 시작 ===")
-            combined_path = self.combine_videos(video_files)
-            if not combined_path:
-                print("[처리] 동영상 결합 실패")
+            # 4~6. 동영상 결합, 메타데이터 생성, 디렉토리 정리
+            assembled = self._assemble(news_list, video_files)
+            if not assembled:
                 return False
-            
-            # 5. 메타데이터 생성
-            print("\n=== 5단계: 메타데이터 생성 시작 ===")
-            metadata_path = self.create_metadata(news_list, combined_path)
-            if not metadata_path:
-                print("[처리] 메타데이터 생성 실패")
-                return False
-            
-            # 6. 디렉토리 정리
-            self._cleanup_old_directories(self.images_dir)
-            self._cleanup_old_directories(self.videos_dir)
+            combined_path, metadata_path = assembled
             
             print("\n=== 처리 완료 ===")
             print(f"- 처리된 뉴스: {len(news_list)}개")
@@ -881,7 +2854,105 @@ class NewsProcessor:
         except Exception as e:
             print(f"[처리] 오류 발생: {e}")
             return False
+        finally:
+            self._finish_run()
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="연합뉴스 RSS 카드뉴스 동영상 생성")
+    parser.add_argument("--watch", action="store_true",
+                        help="상주 모드: 피드를 주기적으로 확인해 새 뉴스를 미리 렌더링")
+    parser.add_argument("--interval", type=int, default=300,
+                        help="상주 모드 피드 확인 주기(초), 기본 300")
+    parser.add_argument("--build-every", type=int, default=None,
+                        help="새 클립이 이 개수만큼 모이면 결합 (기본: RSS.txt 최대 개수)")
+    def build_time(value):
+        try:
+            return normalize_build_time(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"HH:MM 형식이 아닙니다: {value}")
+    
+    parser.add_argument("--build-at", action="append", default=[], metavar="HH:MM", type=build_time,
+                        help="예약 결합 시각 (여러 번 지정 가능)")
+    parser.add_argument("--formats", default=None, metavar="FMT[,FMT...]",
+                        help="멀티 포맷 출력 (shorts,square,landscape 중 선택, 한 번의 FFmpeg 실행)")
+    parser.add_argument("--long-form", action="store_true",
+                        help="롱폼 모드: 실행마다 누적 보관한 최근 뉴스(--days일)를 단계적으로 결합한 모음 동영상")
+    parser.add_argument("--days", type=int, default=7,
+                        help="롱폼 모드에 포함할 보관 기간(일), 기본 7")
+    parser.add_argument("--max-cards", type=int, default=300,
+                        help="롱폼 모드 최대 카드 수, 기본 300")
+    parser.add_argument("--group-size", type=int, default=32,
+                        help="롱폼 모드 한 번에 결합할 클립 수, 기본 32")
+    parser.add_argument("--card-images", action="store_true",
+                        help="RSS 항목의 기사 이미지를 카드에 함께 배치")
+    parser.add_argument("--no-dedupe", action="store_true",
+                        help="카테고리 간 유사 기사 제거 사용 안 함")
+    parser.add_argument("--renderer", choices=["pillow", "drawtext"], default="pillow",
+                        help="카드 렌더러: pillow(카드 PNG) 또는 drawtext(FFmpeg 안에서 텍스트 합성)")
+    parser.add_argument("--compare-renderers", type=int, default=None, metavar="N",
+                        help="뉴스 N개로 Pillow/drawtext 카드 픽셀 차이 비교")
+    parser.add_argument("--bench-renderers", type=int, default=None, metavar="N",
+                        help="뉴스 N개로 Pillow/drawtext 렌더러 속도 비교")
+    parser.add_argument("--latest-video", nargs="?", const="shorts", default=None, metavar="FMT",
+                        help="가장 최근 완료된 실행의 동영상 경로 출력 (기본 shorts)")
+    parser.add_argument("--bench-startup", action="store_true",
+                        help="import 시간 벤치마크 (기준 초과 시 종료 코드 1)")
+    parser.add_argument("--report", action="store_true",
+                        help="실행 이력 보고서 출력 (최신 실행이 기준선보다 느려졌으면 종료 코드 1)")
+    parser.add_argument("--report-window", type=int, default=10, metavar="N",
+                        help="기준선으로 삼을 직전 성공 실행 수, 기본 10")
+    parser.add_argument("--coordinator", default=None, metavar="QUEUE_DIR",
+                        help="작업 큐 코디네이터: 뉴스를 수집해 QUEUE_DIR에 작업을 넣고 워커 결과를 결합")
+    parser.add_argument("--worker", default=None, metavar="QUEUE_DIR",
+                        help="작업 큐 워커: QUEUE_DIR에서 작업을 가져와 카드/클립 생성 (여러 프로세스/호스트 실행 가능)")
+    parser.add_argument("--queue-timeout", type=int, default=1800,
+                        help="코디네이터가 워커 결과를 기다리는 최대 시간(초), 기본 1800")
+    parser.add_argument("--idle-exit", type=int, default=None, metavar="SECONDS",
+                        help="워커가 이 시간 동안 작업이 없으면 종료 (기본: 계속 대기)")
+    args = parser.parse_args()
+    
+    if args.bench_startup:
+        sys.exit(0 if benchmark_startup() else 1)
+    if args.latest_video:
+        latest = find_latest_run(fmt=args.latest_video)
+        if not latest:
+            print(f"완료된 {args.latest_video} 동영상이 없습니다.", file=sys.stderr)
+            sys.exit(1)
+        print(latest["video"])
+        sys.exit(0)
+    if args.report:
+        history_path = os.path.join("output", "run_history.sqlite")
+        if not os.path.exists(history_path):
+            print("[이력] 실행 이력 DB가 없습니다.")
+            sys.exit(0)
+        history = RunHistory(history_path)
+        regressions = history.report(window=args.report_window)
+        history.close()
+        sys.exit(1 if regressions else 0)
+    
     processor = NewsProcessor()
-    processor.process() 
\ No newline at end of file
+    processor.card_images = args.card_images
+    processor.dedupe_news = not args.no_dedupe
+    processor.renderer = args.renderer
+    if args.compare_renderers or args.bench_renderers:
+        news_list = processor.collect_news() or []
+        processor._prefetch_images(news_list)
+        if args.compare_renderers:
+            processor.compare_renderers(news_list[:args.compare_renderers])
+        if args.bench_renderers:
+            processor.benchmark_renderers(news_list[:args.bench_renderers])
+        processor._finish_run()
+    elif args.coordinator:
+        processor.process_coordinator(args.coordinator, timeout=args.queue_timeout)
+    elif args.worker:
+        processor.run_worker(args.worker, idle_exit=args.idle_exit)
+    elif args.watch:
+        processor.watch(interval=args.interval, build_every=args.build_every,
+                        build_times=args.build_at)
+    elif args.long_form:
+        processor.process_long_form(max_cards=args.max_cards, group_size=args.group_size, days=args.days)
+    else:
+        formats = [fmt.strip() for fmt in args.formats.split(',')] if args.formats else None
+        processor.process(formats=formats)
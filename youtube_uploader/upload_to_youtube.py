@@ -1,16 +1,57 @@
 import os
+import glob
 import json
+import time
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from zoneinfo import ZoneInfo  # Python 3.9 이상에서 사용
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 
-def get_authenticated_service():
+STATE_DIR = 'youtube_uploader'
+UPLOADED_FILE = os.path.join(STATE_DIR, 'uploaded.json')
+QUOTA_FILE = os.path.join(STATE_DIR, 'quota.json')
+VIDEOS_DIR = os.path.join('output', 'videos')
+
+# YouTube Data API 할당량 (프로젝트 단위, 태평양 시간 자정에 초기화)
+QUOTA_DAILY_LIMIT = 10000
+QUOTA_UPLOAD_COST = 1600  # videos.insert 1회
+QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+# YouTube 메타데이터 한도
+TITLE_MAX = 100
+DESCRIPTION_MAX_BYTES = 5000
+
+# 오류 이유(reason)별 처리: 한도 초과는 오늘 업로드를 멈추고 다음 실행에서 다시 시도,
+# 메타데이터/요청 자체가 거부된 경우만 영구 실패로 기록 (그 밖의 오류는 다음 실행에서 다시 시도)
+QUOTA_ERROR_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+CHANNEL_LIMIT_REASONS = {'uploadLimitExceeded', 'rateLimitExceeded', 'userRateLimitExceeded'}
+PERMANENT_ERROR_REASONS = {
+    'invalidTitle', 'invalidDescription', 'invalidTags', 'invalidCategoryId',
+    'invalidVideoMetadata', 'invalidRecordingDetails', 'invalidFilename',
+    'mediaBodyRequired', 'defaultLanguageNotSet'
+}
+PERMANENT_HTTP_ERRORS = {413}  # 파일이 너무 큼
+
+# 다른 프로세스가 업로드 중으로 표시한 동영상은 이 시간(초) 동안 건너뜀 (중단된 표시는 이후 무시)
+UPLOAD_CLAIM_TIMEOUT = 2 * 3600
+
+# create_metadata가 쓰는 카테고리 이름 → YouTube categoryId
+CATEGORY_IDS = {
+    "News & Politics": "25",
+    "Entertainment": "24",
+    "People & Blogs": "22"
+}
+
+def get_authenticated_service(channel=None):
     SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
     CLIENT_SECRETS_FILE = 'youtube_uploader/client_secrets.json'
-    TOKEN_FILE = 'youtube_uploader/token.json'
+    # 채널별 토큰은 token_<채널>.json, 기본 채널은 token.json
+    TOKEN_FILE = f'youtube_uploader/token_{channel}.json' if channel else 'youtube_uploader/token.json'
 
     credentials = None
     # token.json이 있으면 바로 사용
@@ -44,10 +85,252 @@ def upload_video(youtube, video_file, title, description, tags=None, categoryId=
         body=body,
         media_body=media
     )
-    response = request.execute()
+    response = request.execute(num_retries=3)
     print(f"Video uploaded: https://youtu.be/{response['id']}")
+    return response['id']
 
-if __name__ == "__main__":
+def _write_json(path, data):
+    """임시 파일에 쓴 뒤 교체 (중간에 끊겨도 기존 기록 유지)"""
+    partial_path = f"{path}.{os.getpid()}.partial"
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(partial_path, path)
+
+def _read_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return default
+
+@contextmanager
+def _file_lock(path):
+    """path.lock에 OS 파일 잠금 (여러 업로드 프로세스가 같은 기록을 동시에 고치지 않게)"""
+    with open(f"{path}.lock", 'a+') as lock_file:
+        if os.name == 'nt':
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+class QuotaLedger:
+    """로컬 할당량 장부: 업로드 전에 단위를 예약해 403(quotaExceeded) 전에 멈춤
+    (같은 프로젝트를 쓰는 여러 프로세스가 함께 쓰므로 읽기-수정-쓰기는 파일 잠금 안에서)"""
+
+    def __init__(self, path=QUOTA_FILE, daily_limit=QUOTA_DAILY_LIMIT):
+        self.path = path
+        self.daily_limit = daily_limit
+        self.lock = threading.Lock()
+
+    def _today(self):
+        return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+    def _load(self):
+        ledger = _read_json(self.path, {})
+        if ledger.get('date') != self._today():
+            ledger = {'date': self._today(), 'used': 0}
+        return ledger
+
+    def remaining(self):
+        with self.lock, _file_lock(self.path):
+            return self.daily_limit - self._load()['used']
+
+    def reserve(self, units):
+        """units만큼 남아 있으면 사용 처리 후 True (실패한 호출도 할당량을 소모하므로 환불하지 않음)"""
+        with self.lock, _file_lock(self.path):
+            ledger = self._load()
+            if ledger['used'] + units > self.daily_limit:
+                return False
+            ledger['used'] += units
+            _write_json(self.path, ledger)
+            return True
+
+    def exhaust(self):
+        """API가 할당량 초과를 알리면 오늘 남은 할당량을 0으로 기록"""
+        with self.lock, _file_lock(self.path):
+            ledger = self._load()
+            ledger['used'] = self.daily_limit
+            _write_json(self.path, ledger)
+
+def _load_upload_record():
+    """업로드 기록 {"uploaded": {...}, "failed": {...}, "uploading": {...}} (이전 형식은 전체가 uploaded)"""
+    record = _read_json(UPLOADED_FILE, {})
+    if 'uploaded' not in record:
+        record = {'uploaded': record}
+    record.setdefault('failed', {})
+    record.setdefault('uploading', {})
+    return record
+
+def _claim_upload(key):
+    """업로드 시작 표시 (이미 끝났거나 다른 프로세스가 업로드 중이면 False)"""
+    with _file_lock(UPLOADED_FILE):
+        record = _load_upload_record()
+        if key in record['uploaded'] or key in record['failed']:
+            return False
+        claim = record['uploading'].get(key)
+        if claim and time.time() - claim['claimed_at'] < UPLOAD_CLAIM_TIMEOUT:
+            return False
+        record['uploading'][key] = {"pid": os.getpid(), "claimed_at": time.time()}
+        _write_json(UPLOADED_FILE, record)
+        return True
+
+def _save_upload_result(section, key, entry=None):
+    """다른 프로세스의 기록을 덮어쓰지 않도록 잠금 안에서 다시 읽고 한 항목만 고침
+    (entry가 없으면 업로드 중 표시만 해제해 다음 실행에서 다시 시도)"""
+    with _file_lock(UPLOADED_FILE):
+        record = _load_upload_record()
+        record['uploading'].pop(key, None)
+        if entry is not None:
+            record[section][key] = entry
+        _write_json(UPLOADED_FILE, record)
+
+def _error_reasons(error):
+    """HttpError 응답 본문의 오류 이유 목록 (예: ['quotaExceeded'])"""
+    try:
+        body = json.loads(error.content.decode('utf-8'))
+        return {item.get('reason') for item in body['error'].get('errors', [])}
+    except Exception:
+        return set()
+
+def _validate_metadata(meta):
+    """업로드해도 항상 거부될 메타데이터면 이유 반환 (할당량을 쓰기 전에 확인)"""
+    for field in ('video_path', 'title', 'description'):
+        if not meta.get(field):
+            return f"{field} 없음"
+    if len(meta['title']) > TITLE_MAX:
+        return f"제목이 {TITLE_MAX}자를 넘음 ({len(meta['title'])}자)"
+    if len(meta['description'].encode('utf-8')) > DESCRIPTION_MAX_BYTES:
+        return f"설명이 {DESCRIPTION_MAX_BYTES}바이트를 넘음"
+    if any(ch in meta['title'] + meta['description'] for ch in '<>'):
+        return "제목/설명에 꺾쇠괄호 포함"
+    return None
+
+def find_pending_uploads(videos_dir=VIDEOS_DIR, record=None):
+    """파이프라인 출력에서 아직 올리지 않았고 영구 실패하지도 않은 메타데이터 목록 (오래된 것부터)"""
+    record = record or {'uploaded': {}, 'failed': {}}
+    pending = []
+    for metadata_path in sorted(glob.glob(os.path.join(videos_dir, '*', 'video_metadata_*.json'))):
+        key = metadata_path.replace("\\", "/")
+        if key in record['uploaded'] or key in record['failed']:
+            continue
+        meta = _read_json(metadata_path, None)
+        if not meta or not os.path.exists(meta.get('video_path', '')):
+            continue
+        pending.append((key, meta))
+    return pending
+
+def upload_pending(videos_dir=VIDEOS_DIR, max_workers=2, limit=None):
+    """대기 중인 동영상을 max_workers개씩 동시에 업로드
+    (업로드 완료/영구 실패 기록으로 같은 동영상을 다시 시도하지 않음)"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = find_pending_uploads(videos_dir, _load_upload_record())[:limit]
+    if not pending:
+        print("[업로드] 대기 중인 동영상이 없습니다.")
+        return 0
+
+    ledger = QuotaLedger()
+    local = threading.local()
+    stop = threading.Event()
+    limited_channels = set()  # 채널별 업로드 한도에 걸린 채널
+    print(f"[업로드] 대기 {len(pending)}개, 남은 할당량 {ledger.remaining()} units")
+
+    def service_for(channel):
+        # API 클라이언트(httplib2)는 스레드 간 공유할 수 없어 스레드마다 생성
+        if not hasattr(local, 'services'):
+            local.services = {}
+        services = local.services
+        if channel not in services:
+            services[channel] = get_authenticated_service(channel)
+        return services[channel]
+
+    def record_failure(key, reason):
+        print(f"[업로드] 영구 실패로 기록, 다시 시도하지 않음 ({key}): {reason}")
+        _save_upload_result('failed', key, {
+            "reason": reason,
+            "failed_at": datetime.now().isoformat(timespec='seconds')
+        })
+
+    def upload_one(job):
+        key, meta = job
+        channel = meta.get('channel')
+        if stop.is_set() or channel in limited_channels or not _claim_upload(key):
+            return False
+        reason = _validate_metadata(meta)
+        if not reason and not os.path.isfile(meta['video_path']):
+            reason = f"동영상 파일 없음: {meta['video_path']}"
+        if reason:
+            record_failure(key, reason)
+            return False
+
+        # 인증 문제는 동영상 탓이 아니므로 할당량을 쓰기 전에 확인하고, 실패하면 다음 실행에서 다시 시도
+        try:
+            youtube = service_for(channel)
+        except Exception as e:
+            print(f"[업로드] 인증 준비 실패 ({channel or '기본 채널'}): {e}")
+            _save_upload_result('uploading', key)
+            return False
+
+        if not ledger.reserve(QUOTA_UPLOAD_COST):
+            print(f"[업로드] 오늘 할당량 부족, 건너뜀: {key}")
+            _save_upload_result('uploading', key)
+            stop.set()
+            return False
+        try:
+            video_id = upload_video(
+                youtube,
+                meta['video_path'],
+                meta['title'],
+                meta['description'],
+                meta.get('tags', []),
+                categoryId=CATEGORY_IDS.get(meta.get('category'), meta.get('category', '22')),
+                privacyStatus=meta.get('privacy_status', 'private')
+            )
+        except HttpError as e:
+            reasons = _error_reasons(e)
+            if reasons & QUOTA_ERROR_REASONS:
+                print("[업로드] YouTube 할당량 초과, 남은 업로드 중단")
+                ledger.exhaust()
+                stop.set()
+                _save_upload_result('uploading', key)
+            elif reasons & CHANNEL_LIMIT_REASONS:
+                print(f"[업로드] 채널 업로드 한도 초과 ({channel or '기본 채널'}), 다음 실행에서 다시 시도")
+                limited_channels.add(channel)
+                _save_upload_result('uploading', key)
+            elif reasons & PERMANENT_ERROR_REASONS or e.resp.status in PERMANENT_HTTP_ERRORS:
+                record_failure(key, f"HTTP {e.resp.status} {', '.join(sorted(reasons))}: {e}")
+            else:
+                print(f"[업로드] 실패 ({key}): {e}")
+                _save_upload_result('uploading', key)
+            return False
+        except Exception as e:
+            print(f"[업로드] 실패 ({key}): {e}")
+            _save_upload_result('uploading', key)
+            return False
+
+        _save_upload_result('uploaded', key, {
+            "video_id": video_id,
+            "video_path": meta['video_path'],
+            "uploaded_at": datetime.now().isoformat(timespec='seconds')
+        })
+        return True
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        done = sum(executor.map(upload_one, pending))
+    print(f"[업로드] {done}/{len(pending)}개 업로드 완료")
+    return done
+
+def upload_legacy():
     youtube = get_authenticated_service()
     # 1. video_metadata.json 파일이 있으면 우선 사용
     if os.path.exists('video_metadata.json'):
@@ -76,3 +359,21 @@ if __name__ == "__main__":
             description,
             tags
         )
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="YouTube 업로드")
+    parser.add_argument("--videos-dir", default=VIDEOS_DIR,
+                        help="video_metadata_*.json을 찾을 파이프라인 출력 디렉토리")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="동시에 업로드할 동영상 수, 기본 2")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="이번 실행에서 업로드할 최대 동영상 수")
+    args = parser.parse_args()
+
+    # 파이프라인 출력이 있으면 업로드 대기열 사용 (모두 올렸으면 아무것도 안 함), 없으면 기존 방식
+    if glob.glob(os.path.join(args.videos_dir, '*', 'video_metadata_*.json')):
+        upload_pending(args.videos_dir, max_workers=args.workers, limit=args.limit)
+    else:
+        upload_legacy()